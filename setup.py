@@ -1,5 +1,4 @@
 from setuptools import setup, find_packages
-from setuptools import setup, find_packages
 
 setup(
     name='glod',
@@ -7,8 +6,3 @@ setup(
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
 )
-
-setup(
-    name='glod',
-    version='0.1.0',
-)
\ No newline at end of file
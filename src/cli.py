@@ -6,18 +6,121 @@ Delegates actual operations to ClientSession.
 """
 import os
 import asyncio
+import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Dict, Optional
 
 from client import ClientSession, StreamEvent, EventType
 from util import (
     print_welcome, print_success, print_error, print_info,
     print_response_footer, print_help, get_console
 )
+from rich.markup import escape
 from rich.panel import Panel
 
 console = get_console()
 
+# Section headers for streamed responses; they never change, so build them once
+_TOOL_CALLS_PANEL = Panel(
+    "🔧 [bold yellow]Tool Calls[/bold yellow]",
+    border_style="yellow",
+    padding=(0, 1)
+)
+_RESPONSE_PANEL = Panel(
+    "📝 [bold cyan]Response[/bold cyan]",
+    border_style="cyan",
+    padding=(0, 1)
+)
+
+
+class _StdinReader:
+    """
+    Hands stdin lines to the event loop through a queue, so waiting for input
+    never blocks the loop.
+    
+    Where the loop can watch stdin (loop.add_reader), lines are split out of
+    whatever bytes are ready in a callback, with no thread or polling involved.
+    Otherwise (regular files, loops without add_reader) one long-lived daemon
+    thread loops on input(); being a daemon it never holds up interpreter exit.
+    """
+    
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._error: Optional[Exception] = None
+        self._pending = bytearray()
+    
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        try:
+            fd = sys.stdin.fileno()
+            loop.add_reader(fd, self._on_readable, loop, fd)
+        except (AttributeError, OSError, ValueError, NotImplementedError):
+            threading.Thread(
+                target=self._read_lines,
+                args=(loop, self._queue),
+                name="cli-input",
+                daemon=True,
+            ).start()
+    
+    def _on_readable(self, loop: asyncio.AbstractEventLoop, fd: int) -> None:
+        encoding = getattr(sys.stdin, "encoding", None) or "utf-8"
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            loop.remove_reader(fd)
+            self._queue.put_nowait(e)
+            return
+        
+        if not data:
+            loop.remove_reader(fd)
+            if self._pending:
+                self._queue.put_nowait(self._pending.decode(encoding, "replace"))
+                self._pending.clear()
+            self._queue.put_nowait(EOFError())
+            return
+        
+        self._pending += data
+        *lines, rest = self._pending.split(b"\n")
+        for line in lines:
+            self._queue.put_nowait(line.decode(encoding, "replace").rstrip("\r"))
+        self._pending = bytearray(rest)
+    
+    def _read_lines(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+        while True:
+            try:
+                item = input()
+            except Exception as e:
+                item = e
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                return  # Event loop is gone
+            if isinstance(item, Exception):
+                return
+    
+    async def readline(self, prompt: str) -> str:
+        """
+        Show prompt and wait for the next line of input.
+        
+        Raises:
+            EOFError (or whatever else stopped the reader) once input has ended
+        """
+        if self._error is not None:
+            raise self._error
+        if self._queue is None:
+            self._start()
+        
+        console.print(prompt, end="")
+        item = await self._queue.get()
+        if isinstance(item, Exception):
+            self._error = item
+            raise item
+        return item
+
 
 class CLI:
     """Command-line interface for GLOD"""
@@ -28,6 +131,15 @@ class CLI:
             project_root = Path(os.getcwd())
         
         self.session = ClientSession(project_root=project_root)
+        self._stdin = _StdinReader()
+        # /command -> handler taking the rest of the line (None if empty), returning 1 to exit
+        self._commands: Dict[str, Callable[[Optional[str]], Awaitable[int]]] = {
+            "exit": self._cmd_exit,
+            "allow": self._cmd_allow,
+            "clear": self._cmd_clear,
+            "server": self._cmd_server,
+            "help": self._cmd_help,
+        }
     
     async def initialize(self) -> bool:
         """Initialize the CLI and ensure server is running"""
@@ -79,36 +191,24 @@ class CLI:
                 if event.type == EventType.TOOL_PHASE_START:
                     in_tool_phase = True
                     console.print()
-                    console.print(
-                        Panel(
-                            "🔧 [bold yellow]Tool Calls[/bold yellow]",
-                            border_style="yellow",
-                            padding=(0, 1)
-                        )
-                    )
+                    console.print(_TOOL_CALLS_PANEL)
                 
                 elif event.type == EventType.TOOL_CALL:
                     console.print(f"  [bold yellow]→[/bold yellow] [cyan]{event.content}[/cyan]")
                 
                 elif event.type == EventType.TOOL_RESULT:
-                    lines = event.content.strip().split('\n')
+                    lines = escape(event.content.strip()).split('\n')
                     if len(lines) == 1 and len(event.content) < 80:
-                        console.print(f"  [bold blue]←[/bold blue] [dim]{event.content}[/dim]")
+                        console.print(f"  [bold blue]←[/bold blue] [dim]{escape(event.content)}[/dim]")
                     else:
-                        console.print(f"  [bold blue]←[/bold blue] [dim]{lines[0]}[/dim]")
-                        for line in lines[1:]:
-                            console.print(f"      {line}")
+                        # One print (and one write) for the whole result, not one per line
+                        rest = "".join(f"\n      {line}" for line in lines[1:])
+                        console.print(f"  [bold blue]←[/bold blue] [dim]{lines[0]}[/dim]{rest}")
                 
                 elif event.type == EventType.TOOL_PHASE_END:
                     in_tool_phase = False
                     console.print()
-                    console.print(
-                        Panel(
-                            "📝 [bold cyan]Response[/bold cyan]",
-                            border_style="cyan",
-                            padding=(0, 1)
-                        )
-                    )
+                    console.print(_RESPONSE_PANEL)
                 
                 elif event.type == EventType.CHUNK:
                     print(event.content, end="", flush=True)
@@ -119,6 +219,9 @@ class CLI:
                 
                 elif event.type == EventType.ERROR:
                     print_error(f"Agent error: {event.content}")
+                
+                elif event.type == EventType.RETRY_WAIT:
+                    print_info(event.content)
             
             print_response_footer()
         
@@ -146,30 +249,32 @@ class CLI:
         
         if subcommand == "start":
             print_info("Starting agent server...")
-            if self.session.start_server():
-                await asyncio.sleep(1)
+            if not await self.session.start_server():
+                print_error("Failed to start agent server")
+            elif await self.session.server_manager.wait_ready(5.0):
                 print_success("Agent server started")
             else:
-                print_error("Failed to start agent server")
+                print_error("Agent server start timed out")
         
         elif subcommand == "stop":
             print_info("Stopping agent server...")
-            if self.session.stop_server():
+            if await self.session.stop_server():
                 print_success("Agent server stopped")
             else:
                 print_error("Failed to stop agent server")
         
         elif subcommand == "restart":
             print_info("Restarting agent server...")
-            if self.session.restart_server():
-                await asyncio.sleep(1)
+            if not await self.session.restart_server():
+                print_error("Failed to restart agent server")
+            elif not await self.session.server_manager.wait_ready(5.0):
+                print_error("Agent server restart timed out")
+            else:
                 try:
                     await self.session.sync_allowed_dirs()
                 except Exception:
                     pass  # Best effort
                 print_success("Agent server restarted")
-            else:
-                print_error("Failed to restart agent server")
         
         elif subcommand == "status":
             if self.session.is_server_running():
@@ -189,32 +294,35 @@ class CLI:
         Returns:
             0 to continue, 1 to exit
         """
-        stripped = prompt.strip()[1:].lower()
-        parts = stripped.split(maxsplit=1)
-        command = parts[0]
-        
-        if command == "exit":
-            return 1
-        
-        elif command == "allow":
-            if len(parts) > 1:
-                await self.handle_allow_command(parts[1])
-            else:
-                print_error("Usage: /allow <directory_path>")
-        
-        elif command == "clear":
-            self.session.clear_history()
-            print_success("Message history cleared")
-        
-        elif command == "server":
-            await self.handle_server_command(parts[1] if len(parts) > 1 else None)
-        
-        elif command == "help":
-            print_help()
-        
-        else:
+        command, _, arg = prompt.strip()[1:].partition(" ")
+        command = command.lower()
+        handler = self._commands.get(command)
+        if handler is None:
             print_error(f"Unknown command: /{command}")
-        
+            return 0
+        return await handler(arg.strip() or None)
+    
+    async def _cmd_exit(self, arg: Optional[str]) -> int:
+        return 1
+    
+    async def _cmd_allow(self, arg: Optional[str]) -> int:
+        if arg is None:
+            print_error("Usage: /allow <directory_path>")
+        else:
+            await self.handle_allow_command(arg)
+        return 0
+    
+    async def _cmd_clear(self, arg: Optional[str]) -> int:
+        self.session.clear_history()
+        print_success("Message history cleared")
+        return 0
+    
+    async def _cmd_server(self, arg: Optional[str]) -> int:
+        await self.handle_server_command(arg)
+        return 0
+    
+    async def _cmd_help(self, arg: Optional[str]) -> int:
+        print_help()
         return 0
     
     async def run(self) -> None:
@@ -231,7 +339,7 @@ class CLI:
         try:
             while True:
                 try:
-                    prompt = console.input(prompt_style)
+                    prompt = await self._stdin.readline(prompt_style)
                 except EOFError:
                     print_info("End of input reached")
                     break
@@ -253,6 +361,6 @@ class CLI:
             return
         
         finally:
-            self.session.stop_server()
+            await self.session.stop_server()
             console.print()
 
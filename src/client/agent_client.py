@@ -20,6 +20,10 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, AsyncGenerator, Callable, Optional
 
+# Delay before the next stream after a connection failure, doubling per consecutive failure
+_BACKOFF_INITIAL = 0.5
+_BACKOFF_MAX = 10.0
+
 
 class EventType(str, Enum):
     """Types of events that can occur during agent communication"""
@@ -30,6 +34,7 @@ class EventType(str, Enum):
     ERROR = "error"
     TOOL_PHASE_START = "tool_phase_start"  # Emitted by client when tool phase begins
     TOOL_PHASE_END = "tool_phase_end"      # Emitted by client when tool phase ends
+    RETRY_WAIT = "retry_wait"              # Emitted by client before backing off after a failure
 
 
 @dataclass
@@ -61,14 +66,18 @@ class AgentClient:
         self.base_url = base_url
         self.client = httpx.AsyncClient(timeout=300.0)
         self.message_history = ""  # encoded json
+        self._backoff = 0.0  # seconds to wait before the next stream
     
     async def health_check(self) -> bool:
         """Check if the agent server is running"""
         try:
             response = await self.client.get(f"{self.base_url}/health")
-            return response.status_code == 200
         except Exception:
             return False
+        if response.status_code != 200:
+            return False
+        self.reset_backoff()
+        return True
 
     def clear_history(self):
         """Clear the message history"""
@@ -110,6 +119,14 @@ class AgentClient:
         except Exception as e:
             raise Exception(f"Error communicating with agent: {e}") from e
 
+    def reset_backoff(self) -> None:
+        """Forget earlier stream failures, e.g. once the server is known to be back up"""
+        self._backoff = 0.0
+    
+    def _stream_failed(self) -> None:
+        """Back off further before the next stream attempt"""
+        self._backoff = min(max(self._backoff * 2, _BACKOFF_INITIAL), _BACKOFF_MAX)
+    
     async def run_stream(self, prompt: str) -> AsyncGenerator[StreamEvent, None]:
         """
         Send a prompt to the agent server with streaming response.
@@ -125,6 +142,14 @@ class AgentClient:
         Raises:
             Exception: If communication with server fails
         """
+        # Don't hammer a server that just dropped or refused us
+        if self._backoff:
+            yield StreamEvent(
+                type=EventType.RETRY_WAIT,
+                content=f"Last request failed; waiting {self._backoff:g}s before retrying"
+            )
+            await asyncio.sleep(self._backoff)
+        
         try:
             async with self.client.stream(
                 "POST",
@@ -136,12 +161,16 @@ class AgentClient:
             ) as response:
                 
                 if response.status_code != 200:
+                    if response.status_code >= 500:
+                        self._stream_failed()
                     yield StreamEvent(
                         type=EventType.ERROR,
                         content=f"Server returned {response.status_code}"
                     )
                     return
                 
+                self.reset_backoff()
+                
                 # Track if we're currently in a tool phase
                 in_tool_phase = False
                 
@@ -168,6 +197,10 @@ class AgentClient:
                                 yield StreamEvent(type=EventType.TOOL_RESULT, content=content)
                             
                             elif event_type == "chunk":
+                                # Empty chunks change nothing on screen; don't wake the caller for them
+                                if not content:
+                                    continue
+                                
                                 # Mark end of tool phase when we get actual response chunks
                                 if in_tool_phase:
                                     in_tool_phase = False
@@ -194,10 +227,17 @@ class AgentClient:
                             )
 
         except httpx.ConnectError:
+            self._stream_failed()
             yield StreamEvent(
                 type=EventType.ERROR,
                 content="Could not connect to agent server"
             )
+        except httpx.TransportError as e:
+            self._stream_failed()
+            yield StreamEvent(
+                type=EventType.ERROR,
+                content=f"Error communicating with agent: {e}"
+            )
         except Exception as e:
             yield StreamEvent(
                 type=EventType.ERROR,
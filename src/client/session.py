@@ -7,8 +7,9 @@ Manages:
 - Allowed directories
 - Server lifecycle (via ServerManager)
 """
-import os
 import asyncio
+import os
+import stat
 from pathlib import Path
 from typing import Optional
 
@@ -43,7 +44,8 @@ class ClientSession:
         self.project_root = project_root
         self.agent_client: Optional[AgentClient] = None
         self.server_manager = ServerManager(project_root=project_root)
-        self.allowed_dirs: list[str] = []
+        # Insertion-ordered set (dict keys): O(1) membership, synced in the order added
+        self.allowed_dirs: dict[str, None] = {}
     
     async def initialize(self) -> bool:
         """
@@ -54,14 +56,14 @@ class ClientSession:
         """
         # Initialize client
         self.agent_client = AgentClient()
-        self.allowed_dirs = [os.getcwd()]
+        self.allowed_dirs = dict.fromkeys([os.getcwd()])
         
         # Check and start server if needed
         if not await self.agent_client.health_check():
-            if not self.server_manager.start():
+            if not await self.server_manager.start_async():
                 return False
             
-            await asyncio.sleep(1)
+            await self.server_manager.wait_ready()
             
             if not await self.agent_client.health_check():
                 return False
@@ -128,14 +130,17 @@ class ClientSession:
         
         abs_path = os.path.abspath(dir_path)
         
-        if not os.path.isdir(abs_path):
+        try:
+            is_dir = stat.S_ISDIR(os.stat(abs_path).st_mode)
+        except OSError:
+            is_dir = False
+        if not is_dir:
             return {
                 "status": "error",
                 "message": f"Directory does not exist: {abs_path}"
             }
         
-        if abs_path not in self.allowed_dirs:
-            self.allowed_dirs.append(abs_path)
+        self.allowed_dirs[abs_path] = None
         
         result = await self.agent_client.add_allowed_dir(abs_path)
         if result.get("status") == "ok":
@@ -157,17 +162,24 @@ class ClientSession:
         if self.agent_client:
             self.agent_client.clear_history()
     
-    def start_server(self) -> bool:
+    async def start_server(self) -> bool:
         """Start the agent server"""
-        return self.server_manager.start()
+        # Shielded so a cancelled caller doesn't cut off the ready bookkeeping
+        started = await asyncio.shield(self.server_manager.start_async())
+        if started and self.agent_client:
+            self.agent_client.reset_backoff()
+        return started
     
-    def stop_server(self) -> bool:
+    async def stop_server(self) -> bool:
         """Stop the agent server"""
-        return self.server_manager.stop()
+        return await asyncio.shield(self.server_manager.stop_async())
     
-    def restart_server(self) -> bool:
+    async def restart_server(self) -> bool:
         """Restart the agent server"""
-        return self.server_manager.restart()
+        restarted = await asyncio.shield(self.server_manager.restart_async())
+        if restarted and self.agent_client:
+            self.agent_client.reset_backoff()
+        return restarted
     
     def is_server_running(self) -> bool:
         """Check if the agent server is running"""
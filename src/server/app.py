@@ -1,20 +1,46 @@
 from pathlib import Path
 
+# Trie marker key; never equal to a path component
+_ALLOWED = object()
+
+def _trie_key(path: Path) -> tuple[str, ...]:
+    """Path components to walk the allowed-path trie with; relative paths get an empty anchor
+    so they never share a branch with absolute ones"""
+    return path.parts if path.anchor else ('',) + path.parts
+
 class App:
     def __init__(self):
         self._allowed_paths = []
+        # Trie of allowed path components; a node holding _ALLOWED marks an allowed root
+        self._allowed_trie: dict = {}
+        # Bumped whenever the policy changes, so cached access checks go stale
+        self._generation = 0
     
     def allow_path(self, path: Path) -> None:
         if path in self._allowed_paths:
             return
         self._allowed_paths.append(path)
+        node = self._allowed_trie
+        for part in _trie_key(Path(path)):
+            node = node.setdefault(part, {})
+        node[_ALLOWED] = True
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        return self._generation
 
     def get_allowed_paths(self) -> list[Path]:
         return self._allowed_paths
 
     def can_access(self, path: Path) -> bool:
-        for allowed_path in self._allowed_paths:
-            if path.is_relative_to(allowed_path):
+        # Allowed if any prefix of the path's components is an allowed root
+        node = self._allowed_trie
+        for part in _trie_key(path):
+            node = node.get(part)
+            if node is None:
+                return False
+            if _ALLOWED in node:
                 return True
         return False
 
@@ -8,6 +8,32 @@ from typing import List
 from pydantic_ai import Agent, Tool
 from pydantic_ai.models.anthropic import AnthropicModel
 
+from server.tools import files, git
+
+
+# Tools a subagent may be given, by name; wrapped once at import rather than per spawn
+_TOOL_REGISTRY = {
+    'list_files': Tool(files.list_files, takes_ctx=False),
+    'read': Tool(files.read, takes_ctx=False),
+    'grep': Tool(files.grep, takes_ctx=False),
+    'touch': Tool(files.touch, takes_ctx=False),
+    'delete': Tool(files.delete, takes_ctx=False),
+    'rm': Tool(files.rm, takes_ctx=False),
+    'insert': Tool(files.insert, takes_ctx=False),
+    'replace': Tool(files.replace, takes_ctx=False),
+    'mkdir': Tool(files.mkdir, takes_ctx=False),
+    'mv': Tool(files.mv, takes_ctx=False),
+    'git_status': Tool(git.git_status, takes_ctx=False),
+    'git_add': Tool(git.git_add, takes_ctx=False),
+    'git_commit': Tool(git.git_commit, takes_ctx=False),
+    'git_push': Tool(git.git_push, takes_ctx=False),
+    'git_pull': Tool(git.git_pull, takes_ctx=False),
+    'git_log': Tool(git.git_log, takes_ctx=False),
+    'git_diff': Tool(git.git_diff, takes_ctx=False),
+    'git_branch': Tool(git.git_branch, takes_ctx=False),
+    'git_checkout': Tool(git.git_checkout, takes_ctx=False),
+}
+
 
 async def spawn_subagent(
     prompt: str,
@@ -32,38 +58,12 @@ async def spawn_subagent(
     Returns:
         The subagent's response as a string
     """
-    # Import here to avoid circular imports
-    from server.tools import files, git
-    
-    # Map tool names to actual tool functions
-    _tool_registry = {
-        'list_files': files.list_files,
-        'read': files.read,
-        'grep': files.grep,
-        'touch': files.touch,
-        'delete': files.delete,
-        'rm': files.rm,
-        'insert': files.insert,
-        'replace': files.replace,
-        'mkdir': files.mkdir,
-        'mv': files.mv,
-        'git_status': git.git_status,
-        'git_add': git.git_add,
-        'git_commit': git.git_commit,
-        'git_push': git.git_push,
-        'git_pull': git.git_pull,
-        'git_log': git.git_log,
-        'git_diff': git.git_diff,
-        'git_branch': git.git_branch,
-        'git_checkout': git.git_checkout,
-    }
-    
     # Validate and get requested tools
-    invalid_tools = [name for name in tool_names if name not in _tool_registry]
+    invalid_tools = [name for name in tool_names if name not in _TOOL_REGISTRY]
     if invalid_tools:
         return f"error: invalid tool names: {invalid_tools}"
     
-    selected_tools = [Tool(_tool_registry[name], takes_ctx=False) for name in tool_names]
+    selected_tools = [_TOOL_REGISTRY[name] for name in tool_names]
     
     # Build system prompt for subagent
     sys_prompt = f"""You are a specialized autonomous subagent.
@@ -90,8 +90,11 @@ Report your findings and actions clearly."""
         return f"error: subagent failed: {e}"
 
 
+_PYDANTIC_AGENT_TOOLS: List[Tool] = [
+    Tool(spawn_subagent, takes_ctx=False),
+]
+
+
 def get_pydantic_agent_tools() -> List[Tool]:
     """Get agent spawning tools as pydantic-ai Tool objects"""
-    return [
-        Tool(spawn_subagent, takes_ctx=False),
-    ]
+    return list(_PYDANTIC_AGENT_TOOLS)
@@ -5,30 +5,93 @@ Provides analysis capabilities:
 - get_file_structure: Extract functions/classes/signatures without full code
 - trace_call_chain: Show which functions call a function and which it calls
 - analyze_imports: Extract and analyze imports in a file
+- analyze_imports_many: Extract imports of many files in parallel
 - get_type_info: Extract type hints for symbols
 """
 import ast
-import json
-from typing import Dict, List, Optional
+import hashlib
+import itertools
+import multiprocessing
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set
 
+import orjson
 from pydantic_ai import Tool
 
 from server.tools.util import _check_access
 
+# On-disk index of analysis results, keyed by file path and validated by mtime/size.
+# Kept in the per-user cache dir, never inside the (possibly untrusted) analyzed tree.
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'glod' / 'analysis'
+_CACHE_MAX_ENTRIES = 2048
+# Pruning scans the whole directory, so it runs on the first store and then every this many
+_PRUNE_EVERY = 64
+_store_count = itertools.count()
+_INDEX_VERSION = 5
+# CodeAnalyzer attributes persisted in the index
+_INDEX_FIELDS = ('functions', 'classes', 'imports', 'call_graph', 'called_by', 'type_hints')
+# Child nodes that can never contain a call or definition worth visiting
+_SKIPPED_NODES = (ast.Name, ast.Constant, ast.expr_context, ast.alias, ast.arguments)
+
 
 class CodeAnalyzer(ast.NodeVisitor):
     """Visitor to analyze Python code structure"""
     
     def __init__(self, source_code: str):
-        self.source_code = source_code
-        self.functions = {}
-        self.classes = {}
-        self.imports = []
-        self.call_graph = {}  # Maps function names to functions they call
-        self.called_by = {}   # Maps function names to functions that call them
-        self.type_hints = {}  # Maps symbols to their type hints
-        self.current_function = None
+        self.source_code: str = source_code
+        self.functions: Dict[str, Dict[str, Any]] = {}
+        self.classes: Dict[str, Dict[str, Any]] = {}
+        self.imports: List[Dict[str, Any]] = []
+        self.call_graph: DefaultDict[str, Set[str]] = defaultdict(set)  # Maps function names to functions they call
+        self.called_by: DefaultDict[str, Set[str]] = defaultdict(set)   # Maps function names to functions that call them
+        self.type_hints: Dict[str, str] = {}  # Maps symbols to their type hints
+        self.current_function: Optional[str] = None
+        self._json_cache: Dict[str, str] = {}  # Serialized fields, filled lazily by to_json
+        # Node type -> handler, replacing NodeVisitor's per-node 'visit_' + name getattr
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.Call: self.visit_Call,
+        }
+    
+    def visit(self, node: ast.AST) -> None:
+        """Dispatch on the node's type via the prebuilt handler table"""
+        self._dispatch.get(type(node), self.generic_visit)(node)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        """
+        Visit children, skipping subtrees that cannot affect the analysis.
         
+        Outside of a function body only statements can hold definitions or imports,
+        so expression subtrees are skipped entirely; calls there are not tracked.
+        """
+        skip_expressions = self.current_function is None
+        # Dispatch children inline (rather than through visit) to save a call per node
+        dispatch = self._dispatch
+        fallback = self.generic_visit
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _SKIPPED_NODES):
+                continue
+            if skip_expressions and isinstance(child, ast.expr):
+                continue
+            dispatch.get(type(child), fallback)(child)
+    
+    def to_json(self, field: str) -> str:
+        """Serialize an analysis field to compact JSON, caching the result on this analyzer"""
+        cached = self._json_cache.get(field)
+        if cached is None:
+            cached = self._json_cache[field] = _dumps(getattr(self, field))
+        return cached
+    
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit function definitions"""
         signature = self._get_function_signature(node)
@@ -42,7 +105,7 @@ class CodeAnalyzer(ast.NodeVisitor):
         # Track calls within this function
         old_function = self.current_function
         self.current_function = node.name
-        self.call_graph[node.name] = []
+        self.call_graph[node.name] = set()
         self.generic_visit(node)
         self.current_function = old_function
     
@@ -59,7 +122,7 @@ class CodeAnalyzer(ast.NodeVisitor):
         
         old_function = self.current_function
         self.current_function = node.name
-        self.call_graph[node.name] = []
+        self.call_graph[node.name] = set()
         self.generic_visit(node)
         self.current_function = old_function
     
@@ -87,24 +150,12 @@ class CodeAnalyzer(ast.NodeVisitor):
     
     def visit_Import(self, node: ast.Import) -> None:
         """Visit import statements"""
-        for alias in node.names:
-            self.imports.append({
-                'type': 'import',
-                'module': alias.name,
-                'alias': alias.asname,
-            })
+        self.imports.extend(_import_entries(node))
         self.generic_visit(node)
     
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Visit from...import statements"""
-        for alias in node.names:
-            self.imports.append({
-                'type': 'from',
-                'module': node.module or '',
-                'name': alias.name,
-                'alias': alias.asname,
-                'level': node.level,  # For relative imports
-            })
+        self.imports.extend(_import_entries(node))
         self.generic_visit(node)
     
     def visit_Call(self, node: ast.Call) -> None:
@@ -113,50 +164,80 @@ class CodeAnalyzer(ast.NodeVisitor):
             # Extract the called function name
             called_name = self._get_call_name(node.func)
             if called_name:
-                if called_name not in self.call_graph[self.current_function]:
-                    self.call_graph[self.current_function].append(called_name)
-                
+                self.call_graph[self.current_function].add(called_name)
                 # Track reverse mapping
-                if called_name not in self.called_by:
-                    self.called_by[called_name] = []
-                if self.current_function not in self.called_by[called_name]:
-                    self.called_by[called_name].append(self.current_function)
+                self.called_by[called_name].add(self.current_function)
         
         self.generic_visit(node)
     
     def _get_function_signature(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
-        """Extract function signature with parameters and return type"""
+        """
+        Extract function signature with parameters and return type.
+        
+        Built from the arguments node only, so the cost scales with the number of
+        parameters rather than the size of the function body. Pieces are collected
+        in one list and joined once.
+        """
         try:
-            # Use ast.unparse if available (Python 3.9+)
-            if hasattr(ast, 'unparse'):
-                return ast.unparse(node)[:200]  # Limit to 200 chars
-            
-            # Fallback: manual signature construction
             args = node.args
-            params = []
+            parts = ['async def ' if isinstance(node, ast.AsyncFunctionDef) else 'def ', node.name, '(']
+            append = parts.append
+            add_param = self._append_param
+            
+            # Defaults align with the tail of the positional parameters
+            positional = args.posonlyargs + args.args
+            defaults = [None] * (len(positional) - len(args.defaults)) + args.defaults
+            num_posonly = len(args.posonlyargs)
             
-            # Regular arguments
-            for arg in args.args:
-                annotation = ''
-                if arg.annotation:
-                    annotation = f': {ast.unparse(arg.annotation)}'
-                params.append(f'{arg.arg}{annotation}')
+            # Positional-only and regular arguments
+            for i, (arg, default) in enumerate(zip(positional, defaults), 1):
+                add_param(parts, arg, default)
+                if i == num_posonly:
+                    append('/, ')
+            
+            # *args, or a bare * separating keyword-only arguments
+            if args.vararg:
+                append('*')
+                add_param(parts, args.vararg)
+            elif args.kwonlyargs:
+                append('*, ')
             
             # Keyword-only arguments
-            for arg in args.kwonlyargs:
-                annotation = ''
-                if arg.annotation:
-                    annotation = f': {ast.unparse(arg.annotation)}'
-                params.append(f'{arg.arg}{annotation}')
+            for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+                add_param(parts, arg, default)
+            
+            # **kwargs
+            if args.kwarg:
+                append('**')
+                add_param(parts, args.kwarg)
+            
+            # Drop the separator after the last parameter
+            if parts[-1].endswith(', '):
+                parts[-1] = parts[-1][:-2]
+            append(')')
             
-            return_type = ''
             if node.returns:
-                return_type = f' -> {ast.unparse(node.returns)}'
+                append(' -> ')
+                append(ast.unparse(node.returns))
             
-            return f"def {node.name}({', '.join(params)}){return_type}"
+            return ''.join(parts)
         except Exception:
             return f"def {node.name}(...)"
     
+    def _append_param(self, parts: List[str], arg: ast.arg, default: Optional[ast.expr] = None) -> None:
+        """Append a single parameter, with its annotation and default value, followed by ', '"""
+        parts.append(arg.arg)
+        if arg.annotation:
+            parts.append(': ')
+            parts.append(ast.unparse(arg.annotation))
+            if default is not None:
+                parts.append(' = ')
+        elif default is not None:
+            parts.append('=')
+        if default is not None:
+            parts.append(ast.unparse(default))
+        parts.append(', ')
+    
     def _extract_type_hints(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> Dict[str, str]:
         """Extract type hints from function arguments and return type"""
         hints = {}
@@ -184,6 +265,197 @@ class CodeAnalyzer(ast.NodeVisitor):
         return None
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON; the output is read by the agent, so no indentation"""
+    return orjson.dumps(obj, default=str).decode()
+
+
+def _import_entries(node: ast.Import | ast.ImportFrom) -> List[Dict[str, Any]]:
+    """Describe each name bound by an import statement"""
+    if isinstance(node, ast.Import):
+        return [
+            {
+                'type': 'import',
+                'module': alias.name,
+                'alias': alias.asname,
+            }
+            for alias in node.names
+        ]
+    return [
+        {
+            'type': 'from',
+            'module': node.module or '',
+            'name': alias.name,
+            'alias': alias.asname,
+            'level': node.level,  # For relative imports
+        }
+        for alias in node.names
+    ]
+
+
+def _group_imports(imports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Group imports by type"""
+    return {
+        'total_imports': len(imports),
+        'regular_imports': [imp for imp in imports if imp['type'] == 'import'],
+        'from_imports': [imp for imp in imports if imp['type'] == 'from'],
+    }
+
+
+def _parse(source: str | bytes, filename: str) -> ast.Module:
+    """
+    Parse source to an AST by calling compile() directly, skipping ast.parse's wrapper.
+    
+    The real filename makes SyntaxErrors point at the file being analyzed.
+    """
+    return compile(source, filename, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+def _parse_imports_worker(file_path: str) -> Dict[str, Any]:
+    """
+    Extract only the imports of a file (runs in a worker process).
+    
+    Walks statements only, since imports cannot appear inside expressions.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            tree = _parse(f.read(), file_path)
+    except SyntaxError as e:
+        return {'error': f"syntax error: {e}"}
+    except Exception as e:
+        return {'error': str(e)}
+    
+    imports = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.extend(_import_entries(node))
+            continue
+        stack.extend(
+            child for child in reversed(list(ast.iter_child_nodes(node)))
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case))
+        )
+    return _group_imports(imports)
+
+
+def _index_path(path: str) -> Path:
+    """Location of the on-disk index entry for a resolved file path"""
+    return _CACHE_DIR / f"{hashlib.sha1(path.encode()).hexdigest()}.json"
+
+
+def _load_index(path: str, mtime_ns: int, size: int) -> Optional[CodeAnalyzer]:
+    """Load a previously indexed analysis if it matches the file's current mtime/size"""
+    index_path = _index_path(path)
+    try:
+        with open(index_path, 'rb') as f:
+            entry = orjson.loads(f.read())
+        if entry['key'] != [_INDEX_VERSION, path, mtime_ns, size]:
+            return None
+        state = entry['state']
+        analyzer = CodeAnalyzer('')
+        analyzer.functions = state['functions']
+        analyzer.classes = state['classes']
+        analyzer.imports = state['imports']
+        analyzer.type_hints = state['type_hints']
+        # Sets are stored as lists in JSON
+        analyzer.call_graph = defaultdict(set, {k: set(v) for k, v in state['call_graph'].items()})
+        analyzer.called_by = defaultdict(set, {k: set(v) for k, v in state['called_by'].items()})
+    except Exception:
+        return None
+    
+    try:
+        # Refresh the mtime so pruning evicts the least recently used entries
+        os.utime(index_path)
+    except OSError:
+        pass
+    return analyzer
+
+
+def _prune_index() -> None:
+    """Drop the least recently used entries once the index has grown past _CACHE_MAX_ENTRIES"""
+    entries = []
+    with os.scandir(_CACHE_DIR) as it:
+        for entry in it:
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                pass
+    if len(entries) <= _CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, stale_path in entries[:len(entries) - _CACHE_MAX_ENTRIES * 3 // 4]:
+        try:
+            os.unlink(stale_path)
+        except OSError:
+            pass
+
+
+def _store_index(path: str, mtime_ns: int, size: int, analyzer: CodeAnalyzer) -> None:
+    """Persist an analysis to the on-disk index (best effort)"""
+    entry = {
+        'key': [_INDEX_VERSION, path, mtime_ns, size],
+        'state': {field: getattr(analyzer, field) for field in _INDEX_FIELDS},
+    }
+    try:
+        _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        index_path = _index_path(path)
+        tmp_path = index_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            # orjson has no set type; call_graph/called_by are written as sorted lists
+            f.write(orjson.dumps(entry, default=sorted))
+        os.replace(tmp_path, index_path)
+        if next(_store_count) % _PRUNE_EVERY == 0:
+            _prune_index()
+    except (OSError, TypeError):
+        pass
+
+
+def _read_source(path: str, size: int) -> bytes:
+    """Read a whole file with raw os.read calls, sized from the stat we already have"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            # Usually one read for the whole file plus one to confirm EOF
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=128)
+def _analyze_cached(path: str, mtime_ns: int, size: int) -> CodeAnalyzer:
+    """Analyze a file, keyed by its mtime/size so edits invalidate the result"""
+    analyzer = _load_index(path, mtime_ns, size)
+    if analyzer is not None:
+        return analyzer
+    
+    source_code = _read_source(path, size).decode('utf-8')
+    tree = _parse(source_code, path)
+    analyzer = CodeAnalyzer(source_code)
+    analyzer.visit(tree)
+    _store_index(path, mtime_ns, size, analyzer)
+    return analyzer
+
+
+def _analyze(file_path: str) -> CodeAnalyzer:
+    """
+    Get the analysis for a file, reusing earlier results while the file is unchanged.
+    
+    Results are memoized in memory and persisted as JSON under the user's cache
+    directory (~/.cache/glod/analysis), so repeated queries (and server restarts)
+    skip re-parsing unchanged files.
+    The returned analyzer is shared and must not be mutated.
+    """
+    path = str(Path(file_path).resolve())
+    st = os.stat(path)
+    return _analyze_cached(path, st.st_mtime_ns, st.st_size)
+
+
 def get_file_structure(file_path: str) -> str:
     """
     Extract functions, classes, and their signatures from a Python file without full code.
@@ -195,27 +467,21 @@ def get_file_structure(file_path: str) -> str:
         JSON string containing file structure with functions and classes
     """
     if not _check_access(file_path):
-        return json.dumps({"error": "access denied to this path"})
+        return _dumps({"error": "access denied to this path"})
     
     try:
-        with open(file_path, 'r') as f:
-            source_code = f.read()
-        
-        tree = ast.parse(source_code)
-        analyzer = CodeAnalyzer(source_code)
-        analyzer.visit(tree)
+        analyzer = _analyze(file_path)
         
-        structure = {
-            'file': file_path,
-            'functions': analyzer.functions,
-            'classes': analyzer.classes,
-        }
-        
-        return json.dumps(structure, indent=2, default=str)
+        # Assemble from per-file cached fragments instead of re-serializing the analysis
+        return (
+            f'{{"file":{_dumps(file_path)},'
+            f'"functions":{analyzer.to_json("functions")},'
+            f'"classes":{analyzer.to_json("classes")}}}'
+        )
     except SyntaxError as e:
-        return json.dumps({"error": f"syntax error: {e}"})
+        return _dumps({"error": f"syntax error: {e}"})
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 def trace_call_chain(function_name: str, file_path: Optional[str] = None) -> str:
@@ -230,33 +496,28 @@ def trace_call_chain(function_name: str, file_path: Optional[str] = None) -> str
         JSON string showing callers and callees
     """
     if file_path and not _check_access(file_path):
-        return json.dumps({"error": "access denied to this path"})
+        return _dumps({"error": "access denied to this path"})
     
     try:
         # If file_path is provided, analyze just that file
         if file_path:
-            with open(file_path, 'r') as f:
-                source_code = f.read()
-            
-            tree = ast.parse(source_code)
-            analyzer = CodeAnalyzer(source_code)
-            analyzer.visit(tree)
+            analyzer = _analyze(file_path)
             
             result = {
                 'function': function_name,
                 'file': file_path,
-                'callers': analyzer.called_by.get(function_name, []),
-                'callees': analyzer.call_graph.get(function_name, []),
+                'callers': sorted(analyzer.called_by.get(function_name, ())),
+                'callees': sorted(analyzer.call_graph.get(function_name, ())),
             }
             
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         else:
-            return json.dumps({"error": "file_path is required for trace_call_chain"})
+            return _dumps({"error": "file_path is required for trace_call_chain"})
     
     except SyntaxError as e:
-        return json.dumps({"error": f"syntax error: {e}"})
+        return _dumps({"error": f"syntax error: {e}"})
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 def analyze_imports(file_path: str) -> str:
@@ -270,32 +531,86 @@ def analyze_imports(file_path: str) -> str:
         JSON string containing all imports grouped by type
     """
     if not _check_access(file_path):
-        return json.dumps({"error": "access denied to this path"})
+        return _dumps({"error": "access denied to this path"})
     
     try:
-        with open(file_path, 'r') as f:
-            source_code = f.read()
-        
-        tree = ast.parse(source_code)
-        analyzer = CodeAnalyzer(source_code)
-        analyzer.visit(tree)
-        
-        # Group imports by type
-        regular_imports = [imp for imp in analyzer.imports if imp['type'] == 'import']
-        from_imports = [imp for imp in analyzer.imports if imp['type'] == 'from']
+        analyzer = _analyze(file_path)
         
         result = {
             'file': file_path,
-            'total_imports': len(analyzer.imports),
-            'regular_imports': regular_imports,
-            'from_imports': from_imports,
+            **_group_imports(analyzer.imports),
         }
         
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
     except SyntaxError as e:
-        return json.dumps({"error": f"syntax error: {e}"})
+        return _dumps({"error": f"syntax error: {e}"})
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
+
+
+# Below this many files, parsing in-process beats shipping paths to the worker pool
+_PARALLEL_IMPORTS_MIN = 32
+_import_pool: Optional[ProcessPoolExecutor] = None
+_import_pool_lock = threading.Lock()
+
+
+def _get_import_pool() -> ProcessPoolExecutor:
+    """Get (or lazily start) the worker pool shared by analyze_imports_many calls"""
+    global _import_pool
+    with _import_pool_lock:
+        if _import_pool is None:
+            # The server is multi-threaded, so don't fork it; forkserver/spawn start clean
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _import_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=context)
+        return _import_pool
+
+
+def _reset_import_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken worker pool; the next call starts a new one"""
+    global _import_pool
+    with _import_pool_lock:
+        if _import_pool is pool:
+            _import_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def analyze_imports_many(file_paths: List[str]) -> str:
+    """
+    Extract and analyze the imports of many Python files at once.
+    
+    Large batches are parsed in parallel worker processes, which makes this much faster
+    than calling analyze_imports once per file for project-wide import graphs.
+    
+    Args:
+        file_paths: Paths to the Python files to analyze
+    
+    Returns:
+        JSON string mapping each file path to its imports grouped by type (or an error)
+    """
+    results: Dict[str, Any] = {}
+    allowed = []
+    for file_path in file_paths:
+        if _check_access(file_path):
+            allowed.append(file_path)
+        else:
+            results[file_path] = {"error": "access denied to this path"}
+    
+    try:
+        if len(allowed) < _PARALLEL_IMPORTS_MIN:
+            results.update(zip(allowed, map(_parse_imports_worker, allowed)))
+        else:
+            pool = _get_import_pool()
+            try:
+                parsed = pool.map(_parse_imports_worker, allowed, chunksize=8)
+                results.update(zip(allowed, parsed))
+            except BrokenProcessPool:
+                _reset_import_pool(pool)
+                raise
+    except Exception as e:
+        return _dumps({"error": str(e)})
+    
+    return _dumps(results)
 
 
 def get_type_info(file_path: str, symbol_name: str) -> str:
@@ -310,15 +625,10 @@ def get_type_info(file_path: str, symbol_name: str) -> str:
         JSON string containing type information for the symbol
     """
     if not _check_access(file_path):
-        return json.dumps({"error": "access denied to this path"})
+        return _dumps({"error": "access denied to this path"})
     
     try:
-        with open(file_path, 'r') as f:
-            source_code = f.read()
-        
-        tree = ast.parse(source_code)
-        analyzer = CodeAnalyzer(source_code)
-        analyzer.visit(tree)
+        analyzer = _analyze(file_path)
         
         result = {
             'file': file_path,
@@ -345,18 +655,22 @@ def get_type_info(file_path: str, symbol_name: str) -> str:
             result['docstring'] = class_info.get('docstring')
             result['methods'] = class_info['methods']
         
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
     except SyntaxError as e:
-        return json.dumps({"error": f"syntax error: {e}"})
+        return _dumps({"error": f"syntax error: {e}"})
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
+
+
+_PYDANTIC_TOOLS: List[Tool] = [
+    Tool(get_file_structure, takes_ctx=False),
+    Tool(trace_call_chain, takes_ctx=False),
+    Tool(analyze_imports, takes_ctx=False),
+    Tool(analyze_imports_many, takes_ctx=False),
+    Tool(get_type_info, takes_ctx=False),
+]
 
 
 def get_pydantic_tools() -> List[Tool]:
     """Get all code understanding tools as pydantic-ai Tool objects"""
-    return [
-        Tool(get_file_structure, takes_ctx=False),
-        Tool(trace_call_chain, takes_ctx=False),
-        Tool(analyze_imports, takes_ctx=False),
-        Tool(get_type_info, takes_ctx=False),
-    ]
+    return list(_PYDANTIC_TOOLS)
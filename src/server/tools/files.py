@@ -1,12 +1,76 @@
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import errno
+import mmap
 import os
+import re
 from pathlib import Path
 import subprocess
 import shutil
+import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pydantic_ai import Tool
 
-from server.tools.util import _check_access
+from server.tools.util import _check_access, _check_access_many
+
+# Files above this size are read lazily up to end_line instead of being loaded and cached whole
+_READ_CACHE_MAX_SIZE = 1024 * 1024
+
+# grep flags that can be evaluated in-process for literal patterns
+_GREP_FLAGS = {
+    'n': 'line_number', 'i': 'ignore_case', 'v': 'invert', 'w': 'word',
+    'x': 'line', 'c': 'count', 'E': 'extended', 'F': 'fixed',
+}
+_GREP_LONG_FLAGS = {
+    '--line-number': 'n', '--ignore-case': 'i', '--invert-match': 'v', '--word-regexp': 'w',
+    '--line-regexp': 'x', '--count': 'c', '--extended-regexp': 'E', '--fixed-strings': 'F',
+}
+# grep stops scanning once its output reaches either limit
+_GREP_MAX_MATCHES = 200
+_GREP_MAX_BYTES = 64 * 1024
+# Files at least this big are scanned through mmap when the pattern is a plain literal
+_GREP_MMAP_MIN_SIZE = 1024 * 1024
+_REGEX_METACHARS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+# grep(1) runs are killed after this many seconds
+_GREP_TIMEOUT = 30
+# list_files results are reused for this many seconds, so outside changes show up within one step.
+# Our own write tools clear the cache immediately.
+_LISTING_TTL = 2.0
+_LISTING_MAX_ENTRIES = 64
+_listing_cache: Dict[Tuple[str, bool], Tuple[float, List[str]]] = {}
+# Tools run on worker threads; the lock guards _listing_cache and the generation, which
+# _invalidate_caches bumps so a listing taken before a write isn't stored after it
+_listing_lock = threading.Lock()
+_listing_generation = 0
+
+def _list_files_uncached(filepath: str, recursive: bool) -> List[str]:
+    """List files under filepath, sorted so results are stable between calls"""
+    if not recursive:
+        # Return full paths for consistency; DirEntry.path is already joined
+        with os.scandir(filepath) as it:
+            return sorted(entry.path for entry in it if entry.is_file())
+    
+    # Iterative scandir walk that stops as soon as the limit is exceeded
+    ret = []
+    stack = [filepath]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        ret.append(entry.path)
+                        if len(ret) > 100:
+                            return ["error: too many files found: more than 100. Use non-recursive mode or filter your search."]
+        except OSError:
+            continue
+    ret.sort()
+    return ret
 
 def list_files(filepath: str, recursive: bool = False) -> List[str]:
     """
@@ -19,23 +83,105 @@ def list_files(filepath: str, recursive: bool = False) -> List[str]:
     if not _check_access(filepath):
         return ["error: access denied to this path"]
     
+    key = (filepath, recursive)
+    now = time.monotonic()
+    with _listing_lock:
+        cached = _listing_cache.get(key)
+        generation = _listing_generation
+    if cached is not None and now - cached[0] < _LISTING_TTL:
+        return list(cached[1])
+    
     try:
-        if not recursive:
-            items = os.listdir(filepath)
-            # Return full paths for consistency
-            return [os.path.join(filepath, item) for item in items if os.path.isfile(os.path.join(filepath, item))]
-        
-        ret = []
-        for root, dirs, files in os.walk(filepath):
-            for file in files:
-                full_path = os.path.join(root, file)
-                ret.append(full_path)
-        
-        if len(ret) > 100:
-            return [f"error: too many files found: {len(ret)}. Use non-recursive mode or filter your search."]
-        return ret
+        ret = _list_files_uncached(filepath, recursive)
     except Exception as e:
         return [f"error: {e}"]
+    
+    with _listing_lock:
+        if generation == _listing_generation:
+            _listing_cache.pop(key, None)
+            if len(_listing_cache) >= _LISTING_MAX_ENTRIES:
+                # Evict the oldest entry
+                del _listing_cache[next(iter(_listing_cache))]
+            _listing_cache[key] = (now, ret)
+    return list(ret)
+
+@lru_cache(maxsize=256)
+def _load_lines(path: str, mtime_ns: int, size: int) -> Tuple[bytes, ...]:
+    """Read a file's raw lines; mtime and size are part of the key so external edits miss the cache"""
+    with open(path, 'rb') as file:
+        return tuple(file.readlines())
+
+
+def _read_lines(filepath: str) -> Tuple[bytes, ...]:
+    """Get a file's lines, served from cache while the file is unchanged"""
+    path = os.path.realpath(filepath)
+    st = os.stat(path)
+    return _load_lines(path, st.st_mtime_ns, st.st_size)
+
+
+def _invalidate_caches() -> None:
+    """Drop cached file contents and listings after a write (file mtimes may not have moved)"""
+    global _listing_generation
+    _load_lines.cache_clear()
+    with _listing_lock:
+        _listing_generation += 1
+        _listing_cache.clear()
+
+
+def _edit_lines(filepath: str, start: int, end: int, insertions: Dict[int, str]) -> None:
+    """
+    Rewrite a file in one streaming pass: drop lines start..end (1-indexed, inclusive;
+    pass end < start to drop nothing) and write insertions[n] before original line n.
+    Insertions past the end of the file are appended in line order.
+    
+    The result goes to a temp file in the same directory and is renamed over the original.
+    """
+    target = os.path.realpath(filepath)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target))
+    try:
+        with open(target, 'r') as src, os.fdopen(fd, 'w') as dst:
+            i = 0
+            for i, line in enumerate(src, 1):
+                if i in insertions:
+                    dst.write(insertions[i] + '\n')
+                if i < start or i > end:
+                    dst.write(line)
+            for line_number in sorted(n for n in insertions if n > i):
+                dst.write(insertions[line_number] + '\n')
+            # Make the new contents durable before the rename publishes them
+            dst.flush()
+            os.fsync(dst.fileno())
+        shutil.copymode(target, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    _invalidate_caches()
+
+
+def _read_line_range_mmap(filepath: str, start: int, end: int) -> List[bytes]:
+    """Lines start..end (1-indexed, inclusive) of a file, found by scanning the mapping for newlines"""
+    with open(filepath, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Skip to the start of the first requested line without materializing skipped lines
+        pos = 0
+        for _ in range(start - 1):
+            newline = mm.find(b'\n', pos)
+            if newline == -1:
+                return []
+            pos = newline + 1
+        
+        lines = []
+        size = len(mm)
+        for _ in range(max(end - start + 1, 0)):
+            if pos >= size:
+                break
+            newline = mm.find(b'\n', pos)
+            stop = size if newline == -1 else newline + 1
+            lines.append(mm[pos:stop])
+            pos = stop
+        return lines
+
 
 def read(filepath: str, start_line: int = 1, end_line: int = 1000) -> str:
     """
@@ -53,15 +199,132 @@ def read(filepath: str, start_line: int = 1, end_line: int = 1000) -> str:
         return "error: access denied to this path"
     
     try:
-        with open(filepath, 'r') as file:
-            lines = file.readlines()
-            ret = []
-            for i in range(start_line-1, min(end_line-1, len(lines))):
-                ret.append(f"{i}: {lines[i]}")
-            return '\n'.join(ret)
+        start = max(start_line, 1)
+        if os.path.getsize(filepath) > _READ_CACHE_MAX_SIZE:
+            lines = _read_line_range_mmap(filepath, start, end_line)
+        else:
+            lines = _read_lines(filepath)[start - 1:end_line]
+        
+        # Format into one bytes buffer and decode once, rather than an f-string per line.
+        # Lines keep their own newlines.
+        buf = bytearray()
+        for i, line in enumerate(lines, start):
+            buf += b'%d: ' % i
+            buf += line
+        return buf.decode('utf-8', 'replace').replace('\r\n', '\n')
     except Exception as e:
         return f"error: {e}"
 
+def read_many(filepaths: List[str], start_line: int = 1, end_line: int = 1000) -> Dict[str, str]:
+    """
+    Read several files at once
+    
+    Args:
+        filepaths: Paths of the files to read
+        start_line: first line to read in each file (1-indexed, default 1)
+        end_line: last line to read in each file (1-indexed, default 1000)
+    
+    Returns:
+        Mapping of each path to its contents as read() would return them (or its error message)
+    """
+    if not filepaths:
+        return {}
+    
+    # Reads are I/O bound, so threads overlap the disk waits
+    with ThreadPoolExecutor(max_workers=min(16, len(filepaths))) as executor:
+        contents = executor.map(lambda path: read(path, start_line, end_line), filepaths)
+        return dict(zip(filepaths, contents))
+
+def _parse_grep_flags(flags: List[str]) -> Optional[set]:
+    """Translate grep flags into option names, or None if any flag is unsupported"""
+    options = set()
+    for flag in flags:
+        if flag.startswith('--'):
+            flag = _GREP_LONG_FLAGS.get(flag)
+            if flag is None:
+                return None
+        elif flag.startswith('-') and len(flag) > 1:
+            flag = flag[1:]
+        else:
+            return None
+        for char in flag:
+            if char not in _GREP_FLAGS:
+                return None
+            if _GREP_FLAGS[char]:
+                options.add(_GREP_FLAGS[char])
+    return options
+
+
+def _scan_lines(filepath: str, pat: re.Pattern, invert: bool) -> Iterator[Tuple[int, str]]:
+    """Yield (line number, line) for each line that matches pat (or doesn't, when inverted)"""
+    with open(filepath, 'r', errors='replace') as f:
+        for i, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if (pat.search(line) is not None) != invert:
+                yield i, line
+
+
+def _scan_literal_mmap(filepath: str, needle: str) -> Iterator[Tuple[int, str]]:
+    """Yield (line number, line) for each line containing needle, letting mmap.find do the scanning"""
+    target = needle.encode()
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        line_number = 1
+        counted_to = 0
+        pos = mm.find(target)
+        while pos != -1:
+            start = mm.rfind(b'\n', 0, pos) + 1
+            end = mm.find(b'\n', pos)
+            if end == -1:
+                end = len(mm)
+            line_number += mm[counted_to:start].count(b'\n')
+            counted_to = start
+            yield line_number, mm[start:end].rstrip(b'\r').decode(errors='replace')
+            pos = mm.find(target, end + 1)
+
+
+def _cap_grep_output(lines: Iterable[str]) -> Optional[str]:
+    """Join output lines up to the match/byte limits, or None when there were none"""
+    out = []
+    size = 0
+    truncated = False
+    for line in lines:
+        if len(out) >= _GREP_MAX_MATCHES or size >= _GREP_MAX_BYTES:
+            truncated = True
+            break
+        out.append(line)
+        size += len(line) + 1
+    
+    if not out:
+        return None
+    if truncated:
+        out.append(f"... (truncated after {len(out)} matches; narrow the pattern to see more)")
+    return '\n'.join(out) + '\n'
+
+
+def _grep_file(filepath: str, needle: str, options: set) -> Optional[str]:
+    """Search a file for a literal string like grep -F would, returning the output or None when nothing matched"""
+    if (needle and not options & {'invert', 'word', 'line', 'ignore_case'}
+            and os.path.getsize(filepath) >= _GREP_MMAP_MIN_SIZE):
+        matches = _scan_literal_mmap(filepath, needle)
+    else:
+        pattern = re.escape(needle)
+        if 'word' in options:
+            # grep -w: no word character directly before or after the match
+            pattern = rf'(?<!\w){pattern}(?!\w)'
+        if 'line' in options:
+            pattern = rf'^{pattern}$'
+        pat = re.compile(pattern, re.IGNORECASE if 'ignore_case' in options else 0)
+        matches = _scan_lines(filepath, pat, 'invert' in options)
+    
+    if 'count' in options:
+        count = sum(1 for _ in matches)
+        return f"{count}\n" if count else None
+    
+    if 'line_number' in options:
+        return _cap_grep_output(f"{i}:{line}" for i, line in matches)
+    return _cap_grep_output(line for _, line in matches)
+
+
 def grep(filepath: str, pattern: str, flags: List[str] = []) -> str:
     """
     Search a file for a given pattern using grep.
@@ -73,22 +336,39 @@ def grep(filepath: str, pattern: str, flags: List[str] = []) -> str:
                Recommend using ['-n'] to include line numbers in results
     
     Returns:
-        Matching lines from the file, or error message
+        Matching lines from the file (truncated after 200 matches or 64KB), or error message
     """
     if not _check_access(filepath):
         return "error: access denied to this path"
     
+    options = _parse_grep_flags(flags)
+    literal = options is not None and '\n' not in pattern and (
+        'fixed' in options or not _REGEX_METACHARS.search(pattern))
+    if literal:
+        # Literal searches are simple enough to match grep exactly, so they skip the fork
+        try:
+            output = _grep_file(filepath, pattern, options)
+            return output if output is not None else "error: no matches found"
+        except Exception as e:
+            return f"error: {e}"
+    
     try:
-        # Correct order: grep [flags] pattern filepath
+        # Regexes and unsupported flags go to grep itself: grep [flags] pattern filepath
         cmd = ['grep'] + flags + [pattern, filepath]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=_GREP_TIMEOUT)
         
         if result.returncode == 0:
-            return result.stdout
+            # Split on newlines only: a \r inside a matched line is part of the line
+            lines = result.stdout.split('\n')
+            if lines[-1] == '':
+                lines.pop()
+            return _cap_grep_output(lines) or "" 
         elif result.returncode == 1:
             return "error: no matches found"
         else:
             return f"error: grep failed with code {result.returncode}: {result.stderr}"
+    except subprocess.TimeoutExpired:
+        return f"error: grep timed out after {_GREP_TIMEOUT}s"
     except Exception as e:
         return f"error: {e}"
     
@@ -103,7 +383,8 @@ def mkdir(filepath: str) -> str:
         return "error: access denied to this path"
     
     try:
-        subprocess.run(['mkdir', filepath], check=True)
+        os.makedirs(filepath, exist_ok=False)
+        _invalidate_caches()
         return f"success: directory created: {filepath}"
     except Exception as e:
         return f"error: {e}"
@@ -119,7 +400,8 @@ def touch(filepath: str) -> str:
         return "error: access denied to this path"
     
     try:
-        subprocess.run(['touch', filepath], check=True)
+        Path(filepath).touch()
+        _invalidate_caches()
         return f"success: file created or updated: {filepath}"
     except Exception as e:
         return f"error: {e}"
@@ -131,13 +413,21 @@ def mv(source: str, dest: str) -> str:
     Returns:
         Success message, or error message
     """
-    if not _check_access(source):
-        return f"error: access denied to this path {source}"
-    if not _check_access(dest):
-        return f"error: access denied to this path {dest}"
+    if not _check_access_many((source, dest)):
+        return f"error: access denied to {source} or {dest}"
     
     try:
-        subprocess.run(['mv', source, dest], check=True)
+        # Like mv, moving onto a directory puts the source inside it
+        if os.path.isdir(dest):
+            dest = os.path.join(dest, os.path.basename(source.rstrip(os.sep)))
+        try:
+            # Same filesystem: a single atomic rename
+            os.replace(source, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(source, dest)
+        _invalidate_caches()
         return f"success: file {source} moved to {dest}"
     except Exception as e:
         return f"error: {e}"
@@ -164,17 +454,7 @@ def delete(filepath: str, start_line: int, end_line: int) -> str:
         return "error: invalid line numbers. start_line and end_line must be >= 1 and start_line <= end_line"
     
     try:
-        
-        with open(filepath, 'r') as file:
-            content = file.readlines()
-        
-        # Convert from 1-indexed to 0-indexed for Python slicing
-        # end_line + 1 because slice is exclusive on the right
-        del content[start_line - 1:end_line]
-
-        with open(filepath, 'w') as file:
-            file.write(''.join(content))
-        
+        _edit_lines(filepath, start_line, end_line, {})
         return f"success: deleted lines {start_line}-{end_line}"
     except Exception as e:
         return f"error: {e}"
@@ -198,17 +478,20 @@ def rm(filepath: str, recursive: bool = False) -> str:
         return "error: access denied to this path"
     
     try:
-        path = Path(filepath)
-        
-        if not path.exists():
+        # One lstat answers exists/file/dir; symlinks are removed themselves, never followed
+        try:
+            mode = os.lstat(filepath).st_mode
+        except FileNotFoundError:
             return f"error: path does not exist: {filepath}"
         
-        if path.is_file():
-            path.unlink()
+        if stat.S_ISREG(mode) or stat.S_ISLNK(mode):
+            os.unlink(filepath)
+            _invalidate_caches()
             return f"success: deleted file: {filepath}"
-        elif path.is_dir():
+        elif stat.S_ISDIR(mode):
             if recursive:
-                shutil.rmtree(path)
+                shutil.rmtree(filepath)
+                _invalidate_caches()
                 return f"success: deleted directory recursively: {filepath}"
             else:
                 return f"error: {filepath} is a directory. Use recursive=True to delete directories."
@@ -239,20 +522,45 @@ def insert(filepath: str, line_number: int, text: str) -> str:
         return "error: line_number must be >= 1"
     
     try:
-        with open(filepath, 'r') as file:
-            content = file.readlines()
-        
-        # Convert from 1-indexed to 0-indexed for Python list.insert()
-        content.insert(line_number - 1, text + '\n')
-        
-        with open(filepath, 'w') as file:
-            file.write(''.join(content))
-        
+        # Empty deletion range: only insert before line_number
+        _edit_lines(filepath, line_number, line_number - 1, {line_number: text})
         return f"success: inserted text at line {line_number}"
     except Exception as e:
         return f"error: {e}"
 
 
+def insert_many(filepath: str, insertions: Dict[int, str]) -> str:
+    """
+    Insert several blocks of text into a file in one pass (1-indexed).
+    
+    Args:
+        filepath: Path to the file
+        insertions: Map of line number to text; each text is inserted BEFORE that line
+                    of the original file (newlines will be added automatically)
+    
+    Returns:
+        Success message, or error message
+    
+    Example:
+        insert_many('file.py', {1: 'import os', 10: 'x = 1'}) inserts 'import os' before
+        original line 1 and 'x = 1' before original line 10
+    """
+    if not _check_access(filepath):
+        return "error: access denied to this path"
+    
+    if not insertions:
+        return "error: no insertions given"
+    if min(insertions) < 1:
+        return "error: line numbers must be >= 1"
+    
+    try:
+        # Line numbers all refer to the original file, so no offsets need adjusting
+        _edit_lines(filepath, 1, 0, insertions)
+        return f"success: inserted text at lines {', '.join(str(n) for n in sorted(insertions))}"
+    except Exception as e:
+        return f"error: {e}"
+
+
 def replace(filepath: str, start_line: int, end_line: int, text: str) -> str:
     """
     Replace lines in a file (1-indexed) with provided text.
@@ -266,25 +574,35 @@ def replace(filepath: str, start_line: int, end_line: int, text: str) -> str:
     Returns:
         Success message or error message
     """
-    delete_resp = delete(filepath, start_line, end_line)
-    if "error" in delete_resp:
-        return delete_resp
-    insert_resp = insert(filepath, start_line, text)
-    if "error" in insert_resp:
-        return insert_resp
-    return f"success: replaced text from {start_line}:{end_line}"
+    if not _check_access(filepath):
+        return "error: access denied to this path"
+    
+    if start_line < 1 or end_line < 1 or start_line > end_line:
+        return "error: invalid line numbers. start_line and end_line must be >= 1 and start_line <= end_line"
+    
+    try:
+        _edit_lines(filepath, start_line, end_line, {start_line: text})
+        return f"success: replaced text from {start_line}:{end_line}"
+    except Exception as e:
+        return f"error: {e}"
+
+
+# Built once at import; Tool() introspects each signature and builds its schema
+_PYDANTIC_TOOLS: List[Tool] = [
+    Tool(list_files, takes_ctx=False, max_retries=3),
+    Tool(read, takes_ctx=False, max_retries=3),
+    Tool(read_many, takes_ctx=False, max_retries=3),
+    Tool(grep, takes_ctx=False, max_retries=3),
+    Tool(touch, takes_ctx=False, max_retries=3),
+    Tool(delete, takes_ctx=False, max_retries=3),
+    Tool(rm, takes_ctx=False, max_retries=3),
+    Tool(insert, takes_ctx=False, max_retries=3),
+    Tool(insert_many, takes_ctx=False, max_retries=3),
+    Tool(replace, takes_ctx=False, max_retries=3),
+    Tool(mkdir, takes_ctx=False, max_retries=3),
+    Tool(mv, takes_ctx=False, max_retries=3)
+]
 
 
 def get_pydantic_tools() -> List[Tool]:
-    return [
-        Tool(list_files, takes_ctx=False, max_retries=3),
-        Tool(read, takes_ctx=False, max_retries=3),
-        Tool(grep, takes_ctx=False, max_retries=3),
-        Tool(touch, takes_ctx=False, max_retries=3),
-        Tool(delete, takes_ctx=False, max_retries=3),
-        Tool(rm, takes_ctx=False, max_retries=3),
-        Tool(insert, takes_ctx=False, max_retries=3),
-        Tool(replace, takes_ctx=False, max_retries=3),
-        Tool(mkdir, takes_ctx=False, max_retries=3),
-        Tool(mv, takes_ctx=False, max_retries=3)
-    ]
+    return list(_PYDANTIC_TOOLS)
@@ -1,10 +1,16 @@
 """
-Git tools for the agent using subprocess commands.
+Git tools for the agent.
+
+Read-only tools (log, diff, branch listing) use pygit2 against a cached
+repository object; everything else shells out to git. Status stays a git
+subprocess so the agent sees git's own long format.
 
 Provides basic git operations:
 - git_status: Check repository status
+- git_current_branch: Get the checked-out branch name
 - git_add: Stage files for commit
 - git_commit: Create a commit
+- git_commit_all: Stage and commit specific files in one step
 - git_push: Push changes to remote
 - git_pull: Pull changes from remote
 - git_log: View commit history
@@ -12,14 +18,96 @@ Provides basic git operations:
 - git_branch: List or create branches
 - git_checkout: Switch branches
 """
-from typing import List
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import itertools
+import os
+import shutil
 import subprocess
+import threading
 from pathlib import Path
 
+import pygit2
 from pydantic_ai import Tool
 
+from server.tools import files as file_tools
 from server.tools.util import _check_access
 
+# Absolute path so subprocess can use posix_spawn instead of fork+exec
+_GIT = shutil.which('git') or 'git'
+
+# Open repositories keyed by git dir, so the odb/refs/index stay loaded across calls.
+# libgit2 repositories aren't thread-safe and tools run on worker threads, so each thread
+# keeps its own bounded cache.
+_REPO_CACHE_MAX = 8
+_repo_local = threading.local()
+# git dir -> generation, bumped when a command moves HEAD or the index so every thread reopens
+_repo_generations: Dict[str, int] = {}
+_generation_counter = itertools.count(1)
+
+
+def _run_git(args: List[str], repo_path: str, timeout: int = 10) -> subprocess.CompletedProcess:
+    """
+    Run a git command against repo_path.
+    
+    Passing the repo with -C instead of cwd, and leaving close_fds off (our fds are
+    non-inheritable anyway), keeps CPython on its posix_spawn fast path.
+    """
+    return subprocess.run(
+        [_GIT, '-C', repo_path] + args,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        close_fds=False
+    )
+
+
+def _repo(repo_path: str) -> pygit2.Repository:
+    """Get this thread's cached Repository containing repo_path, opening it on first use"""
+    root = pygit2.discover_repository(os.path.realpath(repo_path))
+    if root is None:
+        raise ValueError(f"not a git repository: {repo_path}")
+    
+    cache = getattr(_repo_local, 'repos', None)
+    if cache is None:
+        cache = _repo_local.repos = OrderedDict()
+    generation = _repo_generations.get(root, 0)
+    entry = cache.get(root)
+    if entry is None or entry[0] != generation:
+        entry = cache[root] = (generation, pygit2.Repository(root))
+    cache.move_to_end(root)
+    if len(cache) > _REPO_CACHE_MAX:
+        cache.popitem(last=False)
+    return entry[1]
+
+
+def _forget_repo(repo_path: str) -> None:
+    """Make every thread reopen the Repository for repo_path after a command that moves HEAD or the index"""
+    root = pygit2.discover_repository(os.path.realpath(repo_path))
+    if root is not None:
+        _repo_generations[root] = next(_generation_counter)
+
+
+def _worktree_changed(repo_path: str) -> None:
+    """Drop cached repo and file state after a command that rewrote the working tree"""
+    _forget_repo(repo_path)
+    file_tools._invalidate_caches()
+
+
+def _git_dir(repo_path: str) -> Optional[Path]:
+    """Find the git directory for repo_path by walking up to the nearest .git, without opening the repo"""
+    path = Path(repo_path).resolve()
+    for directory in (path, *path.parents):
+        dot_git = directory / '.git'
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Worktrees and submodules point at their git directory from a .git file
+            content = dot_git.read_text().strip()
+            if content.startswith('gitdir: '):
+                return (directory / content.removeprefix('gitdir: ')).resolve()
+    return None
+
 
 def git_status(repo_path: str = ".") -> str:
     """
@@ -35,13 +123,7 @@ def git_status(repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        result = subprocess.run(
-            ['git', 'status'],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = _run_git(['status'], repo_path)
         
         if result.returncode == 0:
             return result.stdout
@@ -53,6 +135,34 @@ def git_status(repo_path: str = ".") -> str:
         return f"error: {e}"
 
 
+def git_current_branch(repo_path: str = ".") -> str:
+    """
+    Get the name of the currently checked-out branch.
+    
+    Much cheaper than git_status when only the branch is needed.
+    
+    Args:
+        repo_path: Path to the git repository (default: current directory)
+    
+    Returns:
+        Branch name, "HEAD detached at <commit>", or error message
+    """
+    if not _check_access(repo_path):
+        return "error: access denied to this path"
+    
+    try:
+        git_dir = _git_dir(repo_path)
+        if git_dir is None:
+            return f"error: not a git repository: {repo_path}"
+        
+        head = (git_dir / 'HEAD').read_text().strip()
+        if head.startswith('ref: '):
+            return head.removeprefix('ref: ').removeprefix('refs/heads/')
+        return f"HEAD detached at {head[:7]}"
+    except Exception as e:
+        return f"error: {e}"
+
+
 def git_add(files: List[str], repo_path: str = ".") -> str:
     """
     Stage files for commit.
@@ -69,14 +179,8 @@ def git_add(files: List[str], repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        cmd = ['git', 'add'] + files
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        cmd = ['add'] + files
+        result = _run_git(cmd, repo_path)
         
         if result.returncode == 0:
             return f"success: staged {len(files)} file(s)"
@@ -103,13 +207,9 @@ def git_commit(message: str, repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        result = subprocess.run(
-            ['git', 'commit', '-m', message],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = _run_git(['commit', '-m', message], repo_path)
+        
+        _forget_repo(repo_path)
         
         if result.returncode == 0:
             return result.stdout
@@ -121,6 +221,52 @@ def git_commit(message: str, repo_path: str = ".") -> str:
         return f"error: {e}"
 
 
+def git_commit_all(files: List[str], message: str, repo_path: str = ".") -> str:
+    """
+    Stage and commit the given files in one step.
+    
+    Only the listed files are committed; anything else already staged is left staged.
+    
+    Args:
+        files: List of file paths to commit (e.g., ['file.py', 'src/util.py'])
+        message: Commit message
+        repo_path: Path to the git repository (default: current directory)
+    
+    Returns:
+        Commit output or error message
+    """
+    if not _check_access(repo_path):
+        return "error: access denied to this path"
+    
+    if not files:
+        return "error: no files given to commit"
+    
+    try:
+        # `git commit -- <paths>` stages tracked paths itself; only untracked ones need a `git add`
+        repo = _repo(repo_path)
+        workdir = os.path.realpath(repo.workdir)
+        untracked = [
+            f for f in files
+            if os.path.relpath(os.path.realpath(os.path.join(repo_path, f)), workdir) not in repo.index
+        ]
+        if untracked:
+            result = _run_git(['add', '--'] + untracked, repo_path)
+            if result.returncode != 0:
+                return f"error: {result.stderr}"
+        
+        result = _run_git(['commit', '-m', message, '--'] + files, repo_path)
+        _forget_repo(repo_path)
+        
+        if result.returncode == 0:
+            return result.stdout
+        else:
+            return f"error: {result.stderr or result.stdout}"
+    except subprocess.TimeoutExpired:
+        return "error: git commit command timed out"
+    except Exception as e:
+        return f"error: {e}"
+
+
 def git_push(branch: str = "", repo_path: str = ".") -> str:
     """
     Push commits to remote repository.
@@ -136,17 +282,11 @@ def git_push(branch: str = "", repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        cmd = ['git', 'push']
+        cmd = ['push']
         if branch:
             cmd.append(branch)
         
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = _run_git(cmd, repo_path, timeout=30)
         
         if result.returncode == 0:
             return result.stdout
@@ -172,13 +312,9 @@ def git_pull(repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        result = subprocess.run(
-            ['git', 'pull'],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = _run_git(['pull'], repo_path, timeout=30)
+        
+        _worktree_changed(repo_path)
         
         if result.returncode == 0:
             return result.stdout
@@ -205,20 +341,16 @@ def git_log(num_commits: int = 10, repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        result = subprocess.run(
-            ['git', 'log', f'-n {num_commits}', '--oneline'],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        repo = _repo(repo_path)
+        if repo.head_is_unborn:
+            return "error: current branch does not have any commits yet"
         
-        if result.returncode == 0:
-            return result.stdout
-        else:
-            return f"error: {result.stderr}"
-    except subprocess.TimeoutExpired:
-        return "error: git log command timed out"
+        lines = []
+        for commit in repo.walk(repo.head.target, pygit2.enums.SortMode.TIME):
+            if len(lines) >= num_commits:
+                break
+            lines.append(f"{commit.short_id} {commit.message.splitlines()[0] if commit.message else ''}")
+        return '\n'.join(lines) + '\n' if lines else ""
     except Exception as e:
         return f"error: {e}"
 
@@ -238,24 +370,26 @@ def git_diff(file_path: str = "", repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        cmd = ['git', 'diff']
-        if file_path:
-            cmd.append(file_path)
-        
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        repo = _repo(repo_path)
+        # Working tree against the index, like a bare `git diff`
+        diff = repo.diff()
         
-        if result.returncode == 0:
-            return result.stdout if result.stdout else "no changes"
+        if file_path:
+            # Paths in the diff are relative to the worktree root, file_path to repo_path
+            target = os.path.relpath(
+                os.path.realpath(os.path.join(repo_path, file_path)),
+                os.path.realpath(repo.workdir),
+            )
+            patches = [
+                patch for patch in diff
+                if target == '.' or patch.delta.new_file.path == target
+                or patch.delta.new_file.path.startswith(target + '/')
+            ]
+            output = ''.join(patch.text for patch in patches)
         else:
-            return f"error: {result.stderr}"
-    except subprocess.TimeoutExpired:
-        return "error: git diff command timed out"
+            output = diff.patch or ""
+        
+        return output if output else "no changes"
     except Exception as e:
         return f"error: {e}"
 
@@ -275,20 +409,21 @@ def git_branch(branch_name: str = "", repo_path: str = ".") -> str:
         return "error: access denied to this path"
     
     try:
-        if branch_name:
-            # Create new branch
-            cmd = ['git', 'branch', branch_name]
-        else:
-            # List branches
-            cmd = ['git', 'branch', '-a']
+        if not branch_name:
+            # List branches, formatted like `git branch -a`
+            repo = _repo(repo_path)
+            current = None if repo.head_is_detached else repo.references.get('HEAD').target
+            lines = []
+            for name in sorted(repo.branches.local):
+                marker = '*' if f"refs/heads/{name}" == current else ' '
+                lines.append(f"{marker} {name}")
+            for name in sorted(repo.branches.remote):
+                lines.append(f"  remotes/{name}")
+            return '\n'.join(lines) + '\n' if lines else ""
         
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        # Create new branch
+        cmd = ['branch', branch_name]
+        result = _run_git(cmd, repo_path)
         
         if result.returncode == 0:
             return result.stdout
@@ -318,13 +453,9 @@ def git_checkout(branch: str, repo_path: str = ".") -> str:
         return "error: branch name is required"
     
     try:
-        result = subprocess.run(
-            ['git', 'checkout', branch],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = _run_git(['checkout', branch], repo_path)
+        
+        _worktree_changed(repo_path)
         
         if result.returncode == 0:
             return result.stdout
@@ -336,17 +467,22 @@ def git_checkout(branch: str, repo_path: str = ".") -> str:
         return f"error: {e}"
 
 
+_PYDANTIC_GIT_TOOLS: List[Tool] = [
+    Tool(git_status, takes_ctx=False),
+    Tool(git_current_branch, takes_ctx=False),
+    Tool(git_add, takes_ctx=False),
+    Tool(git_commit, takes_ctx=False),
+    Tool(git_commit_all, takes_ctx=False),
+    Tool(git_push, takes_ctx=False),
+    Tool(git_pull, takes_ctx=False),
+    Tool(git_log, takes_ctx=False),
+    Tool(git_diff, takes_ctx=False),
+    Tool(git_branch, takes_ctx=False),
+    Tool(git_checkout, takes_ctx=False),
+]
+
+
 def get_pydantic_git_tools() -> List[Tool]:
     """Get all git tools as pydantic-ai Tool objects"""
-    return [
-        Tool(git_status, takes_ctx=False),
-        Tool(git_add, takes_ctx=False),
-        Tool(git_commit, takes_ctx=False),
-        Tool(git_push, takes_ctx=False),
-        Tool(git_pull, takes_ctx=False),
-        Tool(git_log, takes_ctx=False),
-        Tool(git_diff, takes_ctx=False),
-        Tool(git_branch, takes_ctx=False),
-        Tool(git_checkout, takes_ctx=False),
-    ]
+    return list(_PYDANTIC_GIT_TOOLS)
 
@@ -10,7 +10,10 @@ metadata stored in the .glod folder. These tools allow the agent to:
 - Query and save project metadata for context-aware responses
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_ai import Tool
 
@@ -18,6 +21,78 @@ import server.lib.glod as glod_lib
 from server.tools.util import _check_access
 
 
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of path, or None if it doesn't exist"""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _load_overview(project_root: Path, mtime_ns: Optional[int]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Load the overview along with the structure flags derived from it.
+    
+    Keyed on overview.md's mtime, so edits to the file are picked up on the next call.
+    """
+    overview = glod_lib.get_overview(project_root)
+    if not overview:
+        return overview, {"status": "no_overview"}
+    
+    structure_info = {
+        "has_overview": True,
+        "overview_length": len(overview),
+        "is_large_project": len(overview) > 2000,
+    }
+    
+    # Look for common directory patterns in overview
+    if "src/" in overview:
+        structure_info["has_src_dir"] = True
+    if "tests/" in overview or "test/" in overview:
+        structure_info["has_tests_dir"] = True
+    if "docs/" in overview:
+        structure_info["has_docs_dir"] = True
+    
+    return overview, structure_info
+
+
+@lru_cache(maxsize=32)
+def _load_config(project_root: Path, mtime_ns: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Load config.json, keyed on its mtime"""
+    return glod_lib.get_config(project_root)
+
+
+def _glod_signature(project_root: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """(path, mtime_ns, size) of every entry in .glod/ and .glod/tools/, so any metadata edit changes it"""
+    entries = []
+    for directory in (project_root / ".glod", project_root / ".glod" / "tools"):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+    return tuple(sorted(entries))
+
+
+@lru_cache(maxsize=32)
+def _load_project_info(project_root: Path, signature: Tuple[Tuple[str, int, int], ...]) -> Dict[str, Any]:
+    """Load the full project info, keyed on the .glod metadata it's built from"""
+    return glod_lib.get_project_info(project_root)
+
+
+def _overview(project_root: Path) -> Tuple[Optional[str], Dict[str, Any]]:
+    project_root = project_root.resolve()
+    return _load_overview(project_root, _mtime_ns(project_root / ".glod" / "overview.md"))
+
+
+def _config(project_root: Path) -> Optional[Dict[str, Any]]:
+    project_root = project_root.resolve()
+    return _load_config(project_root, _mtime_ns(project_root / ".glod" / "config.json"))
+
+
 def get_project_overview(root: str) -> str:
     """
     Get a brief overview of the project.
@@ -36,7 +111,7 @@ def get_project_overview(root: str) -> str:
 
     try:
         project_root = Path(root)
-        overview = glod_lib.get_overview(project_root)
+        overview, _ = _overview(project_root)
         
         if overview is None:
             return "Error: No project overview found. Create .glod/overview.md for better context."
@@ -64,7 +139,7 @@ def get_project_config(root: str) -> Dict[str, Any]:
 
     try:
         project_root = Path(root)
-        config = glod_lib.get_config(project_root)
+        config = _config(project_root)
         
         if config is None:
             return {
@@ -72,7 +147,8 @@ def get_project_config(root: str) -> Dict[str, Any]:
                 "message": "No config.json found in .glod/. Create one for custom configuration."
             }
         
-        return config
+        # Hand out a copy so callers can't modify the cached config
+        return copy.deepcopy(config)
     except Exception as e:
         return {"error": str(e)}
 
@@ -128,8 +204,10 @@ def get_full_project_info(root: str) -> Dict[str, Any]:
         return {"error": "access denied to this path"}
 
     try:
-        project_root = Path(root)
-        return glod_lib.get_project_info(project_root)
+        project_root = Path(root).resolve()
+        info = _load_project_info(project_root, _glod_signature(project_root))
+        # Hand out a copy so callers can't modify the cached info
+        return copy.deepcopy(info)
     except Exception as e:
         return {"error": str(e)}
 
@@ -215,31 +293,23 @@ def get_project_structure_info(root: str) -> Dict[str, Any]:
 
     try:
         project_root = Path(root)
-        overview = glod_lib.get_overview(project_root)
-        
-        if not overview:
-            return {"status": "no_overview"}
-        
-        # Extract structure information
-        structure_info = {
-            "has_overview": True,
-            "overview_length": len(overview),
-            "is_large_project": len(overview) > 2000,
-        }
-        
-        # Look for common directory patterns in overview
-        if "src/" in overview:
-            structure_info["has_src_dir"] = True
-        if "tests/" in overview or "test/" in overview:
-            structure_info["has_tests_dir"] = True
-        if "docs/" in overview:
-            structure_info["has_docs_dir"] = True
-        
-        return structure_info
+        _, structure_info = _overview(project_root)
+        return dict(structure_info)
     except Exception as e:
         return {"error": str(e)}
 
 
+_PYDANTIC_TOOLS: List[Tool] = [
+    Tool(get_project_overview, takes_ctx=False),
+    Tool(get_project_config, takes_ctx=False),
+    Tool(list_available_tools, takes_ctx=False),
+    Tool(get_full_project_info, takes_ctx=False),
+    Tool(get_file_from_project, takes_ctx=False),
+    Tool(save_project_metadata, takes_ctx=False),
+    Tool(get_project_structure_info, takes_ctx=False),
+]
+
+
 def get_pydantic_tools() -> List[Tool]:
     """
     Get all GLOD tools as Pydantic AI Tool objects.
@@ -247,13 +317,5 @@ def get_pydantic_tools() -> List[Tool]:
     Returns:
         List of Tool objects for use with Pydantic AI agent
     """
-    return [
-        Tool(get_project_overview, takes_ctx=False),
-        Tool(get_project_config, takes_ctx=False),
-        Tool(list_available_tools, takes_ctx=False),
-        Tool(get_full_project_info, takes_ctx=False),
-        Tool(get_file_from_project, takes_ctx=False),
-        Tool(save_project_metadata, takes_ctx=False),
-        Tool(get_project_structure_info, takes_ctx=False),
-    ]
+    return list(_PYDANTIC_TOOLS)
 
@@ -1,12 +1,34 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
 
-from server.app import get_app
+from server.app import App, get_app
 
-def _check_access(filepath: str) -> bool:
-    """Check if the app allows access to this filepath"""
-    app = get_app()
+@lru_cache(maxsize=1024)
+def _can_access_resolved(app: App, generation: int, path: Path) -> bool:
+    """Check an already resolved path against app's policy; cached per policy generation"""
+    return app.can_access(path)
+
+def _resolve_access(app: App, generation: int, filepath: str) -> bool:
+    """
+    Resolve filepath and check it against app's policy.
+    
+    Resolution runs on every call, since a path that was fine a moment ago may
+    since have been replaced by a symlink leading outside the allowed roots.
+    """
     try:
         path = Path(filepath).resolve()
-        return app.can_access(path)
     except Exception:
-        return False
\ No newline at end of file
+        return False
+    return _can_access_resolved(app, generation, path)
+
+def _check_access(filepath: str) -> bool:
+    """Check if the app allows access to this filepath"""
+    app = get_app()
+    return _resolve_access(app, app.generation, filepath)
+
+def _check_access_many(filepaths: Iterable[str]) -> bool:
+    """Check that the app allows access to every one of filepaths, against a single policy snapshot"""
+    app = get_app()
+    generation = app.generation
+    return all(_resolve_access(app, generation, filepath) for filepath in filepaths)
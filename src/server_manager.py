@@ -8,15 +8,94 @@ Handles:
 - Health checks
 - Finding existing processes by port
 """
+import os
+import select
+import signal
 import subprocess
 import sys
 import time
 import asyncio
 import socket
+import struct
 from pathlib import Path
 from util import print_success, print_error, print_info
 
 
+def _find_pid_on_port(port: int) -> int | None:
+    """
+    Find the pid listening on a TCP port by reading /proc (Linux only).
+    
+    Looks up the listening socket's inode in /proc/net/tcp{,6}, then finds the
+    process holding an fd to that socket.
+    
+    Returns:
+        The pid, or None if no listener was found
+    """
+    inodes = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f)  # header
+                for row in f:
+                    fields = row.split()
+                    # fields: sl local_address rem_address st ... inode (index 9); st 0A is LISTEN
+                    if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        inodes.add(f"socket:[{fields[9]}]")
+        except OSError:
+            continue
+    if not inodes:
+        return None
+    
+    with os.scandir("/proc") as procs:
+        for proc in procs:
+            if not proc.name.isdigit():
+                continue
+            try:
+                with os.scandir(f"/proc/{proc.name}/fd") as fds:
+                    for fd in fds:
+                        try:
+                            if os.readlink(fd.path) in inodes:
+                                return int(proc.name)
+                        except OSError:
+                            continue
+            except OSError:
+                # Process exited or belongs to another user
+                continue
+    return None
+
+
+def _terminate_pid(pid: int, timeout: float = 1.0) -> None:
+    """Send SIGTERM to pid, then SIGKILL if it hasn't exited after timeout"""
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    
+    os.kill(pid, signal.SIGTERM)
+    if pidfd is not None:
+        # The pidfd turns readable once the process exits, zombie or not
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            if poller.poll(int(timeout * 1000)):
+                return
+        finally:
+            os.close(pidfd)
+    else:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return
+            time.sleep(0.02)
+    
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
 class ServerManager:
     """Manages the agent server subprocess"""
     
@@ -24,16 +103,85 @@ class ServerManager:
         self.process = None
         # project_root defaults to the directory from which the CLI was invoked
         self.project_root = project_root or Path.cwd()
+        # port -> (monotonic time, in use) of the last probe
+        self._port_probes: dict[int, tuple[float, bool]] = {}
+        # Set once the server is seen listening (by the *_async methods or wait_ready), cleared while it's down
+        self.ready = asyncio.Event()
 
 
-    def _is_port_in_use(self, port: int = 8000) -> bool:
-        """Check if the server port is already in use (indicates server is running)"""
+    def _is_port_in_use(self, port: int = 8000, max_age: float = 0.1) -> bool:
+        """
+        Check if the server port is already in use (indicates server is running)
+        
+        Args:
+            port: Port to probe
+            max_age: Reuse a probe result up to this many seconds old (0 to always probe)
+        """
+        now = time.monotonic()
+        probe = self._port_probes.get(port)
+        if probe is not None and now - probe[0] < max_age:
+            return probe[1]
+        
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                result = sock.connect_ex(('127.0.0.1', port))
-                return result == 0
+                sock.settimeout(0.05)
+                # Reset instead of FIN on close, so probes don't leave TIME_WAIT sockets behind
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                in_use = sock.connect_ex(('127.0.0.1', port)) == 0
         except Exception:
+            in_use = False
+        self._port_probes[port] = (now, in_use)
+        return in_use
+    
+    def _child_owns_port(self, port: int = 8000) -> bool:
+        """
+        Check that the listener on port is our child, not a stale server from elsewhere.
+        
+        Without /proc there is no way to find the owner, so the port probe alone has to do.
+        """
+        owner = _find_pid_on_port(port)
+        if owner is None and not os.path.exists("/proc/net/tcp"):
+            return True
+        return owner == self.process.pid
+    
+    def _wait_for_startup(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until our child is listening on the server port, or it exits.
+        
+        Waits on a pidfd so a crash is noticed within one 50ms tick; falls back
+        to polling the process where pidfd_open isn't available. A foreign process
+        already holding the port doesn't count: the child will fail to bind and exit.
+        
+        Returns:
+            True once the child is listening, False if it exited or the timeout passed
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            pidfd = os.pidfd_open(self.process.pid)
+        except (AttributeError, OSError):
+            pidfd = None
+        
+        try:
+            poller = None
+            if pidfd is not None:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+            
+            while time.monotonic() < deadline:
+                if self._is_port_in_use(8000, max_age=0) and self._child_owns_port(8000):
+                    return self.process.poll() is None
+                if poller is not None:
+                    # Readable pidfd means the child exited
+                    if poller.poll(50):
+                        return False
+                else:
+                    if self.process.poll() is not None:
+                        return False
+                    time.sleep(0.05)
             return False
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
     
     def start(self) -> bool:
         """
@@ -56,8 +204,8 @@ class ServerManager:
                 text=True
             )
 
-            # Give the server a moment to start
-            time.sleep(1)
+            # Wait for the server to listen (or die) instead of sleeping a fixed second
+            self._wait_for_startup()
             
             # Check if process is still running
             if self.process.poll() is None:
@@ -112,16 +260,21 @@ class ServerManager:
         if not stopped and self._is_port_in_use(8000):
             print_info("No local process reference, but server is running on port 8000. Attempting to kill...")
             try:
-                # Use lsof to find and kill the process on port 8000
-                result = subprocess.run(
-                    ["lsof", "-ti:8000"],
-                    capture_output=True,
-                    text=True
-                )
-                if result.stdout.strip():
-                    pid = result.stdout.splitlines()[0].strip()
-                    subprocess.run(["kill", pid])
-                    time.sleep(1)
+                if sys.platform == "linux":
+                    # Read the listener straight from /proc instead of spawning lsof
+                    pid = _find_pid_on_port(8000)
+                else:
+                    # Use lsof to find the process on port 8000
+                    result = subprocess.run(
+                        ["lsof", "-ti:8000"],
+                        capture_output=True,
+                        text=True
+                    )
+                    pid = int(result.stdout.splitlines()[0]) if result.stdout.strip() else None
+                
+                if pid is not None:
+                    # Signal directly rather than spawning kill(1)
+                    _terminate_pid(pid)
                     print_success(f"Agent server killed (PID: {pid})")
                     stopped = True
             except Exception as e:
@@ -129,7 +282,7 @@ class ServerManager:
                 return False
         
         # If nothing was stopped, log it only if port is truly not in use
-        if not stopped and not self._is_port_in_use(8000):
+        if not stopped and not self._is_port_in_use(8000, max_age=0):
             print_info("Agent server is not running")
         
         return True
@@ -143,9 +296,58 @@ class ServerManager:
         """
         print_info("Restarting agent server...")
         self.stop()
-        time.sleep(2)  # Give server more time to fully initialize after restart
+        # Wait (up to 2s) for the old server to release the port rather than a fixed sleep
+        for _ in range(100):
+            if not self._is_port_in_use(8000, max_age=0):
+                break
+            time.sleep(0.02)
         return self.start()
     
+    async def start_async(self) -> bool:
+        """Start the agent server without blocking the event loop"""
+        self.ready.clear()
+        started = await asyncio.to_thread(self.start)
+        if started and await asyncio.to_thread(self._is_port_in_use):
+            self.ready.set()
+        return started
+    
+    async def stop_async(self) -> bool:
+        """Stop the agent server without blocking the event loop"""
+        self.ready.clear()
+        return await asyncio.to_thread(self.stop)
+    
+    async def restart_async(self) -> bool:
+        """Restart the agent server without blocking the event loop"""
+        self.ready.clear()
+        restarted = await asyncio.to_thread(self.restart)
+        if restarted and await asyncio.to_thread(self._is_port_in_use):
+            self.ready.set()
+        return restarted
+    
+    async def wait_ready(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for the server to become ready.
+        
+        Returns as soon as ready is set. Until then the port is probed every 25ms,
+        so a server that was slow to come up (or was started elsewhere) is noticed.
+        
+        Returns:
+            True once the server is ready, False if the timeout passed first
+        """
+        deadline = time.monotonic() + timeout
+        while not self.ready.is_set():
+            if await asyncio.to_thread(self._is_port_in_use, 8000, 0):
+                self.ready.set()
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self.ready.wait(), timeout=min(0.025, remaining))
+            except asyncio.TimeoutError:
+                pass
+        return True
+    
     def is_running(self) -> bool:
         """Check if the agent server process is running"""
         if self.process is None:
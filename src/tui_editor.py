@@ -9,29 +9,172 @@ Features:
 - Command palette with /help, /clear, /allow, /server commands
 """
 import asyncio
+from collections import deque
 from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.keys import Keys
+from rich.text import Text
 
 from client import ClientSession, EventType
 
 from util import get_console
 
+# Oldest messages are dropped once the local history reaches this length
+MAX_HISTORY = 500
+
+# Streamed text is written once this much is buffered...
+CHUNK_FLUSH_SIZE = 256
+# ...or this many seconds after the first unwritten chunk, whichever comes first
+CHUNK_FLUSH_INTERVAL = 0.05
+
+
+# Events read ahead of the terminal before the network side is paused
+EVENT_QUEUE_SIZE = 256
+
+_STREAM_END = object()
+
+# Parsed once; the markup never changes
+HELP_TEXT = Text.from_markup("""[bold cyan]Available Commands:[/bold cyan]
+
+[yellow]/allow <path>[/yellow]        Add a directory to allowed file access paths
+[yellow]/clear[/yellow]              Clear message history
+[yellow]/server start[/yellow]       Start the agent server
+[yellow]/server stop[/yellow]        Stop the agent server
+[yellow]/server restart[/yellow]     Restart the agent server
+[yellow]/server status[/yellow]      Check agent server status
+[yellow]/status[/yellow]             Show server and session status
+[yellow]/help[/yellow]               Show this help message
+[yellow]/exit[/yellow]               Exit GLOD
+
+""")
+
+
+def _raw_output(console):
+    """
+    Get write/flush functions that put plain text under Rich, onto the bytes
+    stream behind the console's file when it has one.
+    """
+    file = console.file
+    buffer = getattr(file, "buffer", None)
+    if buffer is None:
+        return file.write, file.flush
+    encoding = getattr(file, "encoding", None) or "utf-8"
+    
+    def write(text: str) -> None:
+        # Rich flushes the text layer after every print, so nothing is queued ahead of this
+        buffer.write(text.encode(encoding, "replace"))
+    
+    return write, buffer.flush
+
+
+# Stands in for dynamic text when pre-rendering markup around it
+_SLOT = "\ufffc"
+
+
+def _render_markup(console, markup: str) -> str:
+    """Render markup to the escape-coded text the console would write for it"""
+    with console.capture() as capture:
+        console.print(markup, end="", highlight=False, soft_wrap=True)
+    return capture.get()
+
+
+class _ChunkBuffer:
+    """Batches streamed model text into fewer, larger terminal writes"""
+    
+    def __init__(self, write, flush):
+        self._write = write
+        self._flush = flush
+        self._parts: list[str] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+    
+    def append(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= CHUNK_FLUSH_SIZE:
+            self.flush()
+        elif self._timer is None:
+            # Bound how long text can sit unseen if the stream pauses
+            self._timer = asyncio.get_running_loop().call_later(CHUNK_FLUSH_INTERVAL, self.flush)
+    
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._parts:
+            self._write("".join(self._parts))
+            self._flush()
+            self._parts.clear()
+            self._size = 0
+
+
+async def _read_ahead(stream: AsyncIterator, maxsize: int = EVENT_QUEUE_SIZE) -> AsyncIterator:
+    """
+    Re-yield events from stream, fetched by a separate task into a bounded queue.
+    
+    The response keeps being read while output is written, and a full queue
+    applies backpressure to the reader instead of buffering without limit.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+    
+    async def drain() -> None:
+        try:
+            async for event in stream:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+    
+    reader = asyncio.create_task(drain())
+    try:
+        while (event := await queue.get()) is not _STREAM_END:
+            if isinstance(event, Exception):
+                raise event
+            yield event
+    finally:
+        reader.cancel()
+
+
 class GlodTUIEditor:
     def __init__(self, project_root: Path | None = None):
         self.console = get_console()
         self.session = ClientSession(project_root=project_root)
+        self._stdout_write, self._stdout_flush = _raw_output(self.console)
+        # Streaming markers, rendered once and then written raw alongside the model text
+        self._agent_label = _render_markup(self.console, "\n[bold green]Agent:[/bold green] ")
+        self._tool_call_open, _, self._tool_call_close = _render_markup(
+            self.console, f"\n[cyan]→ {_SLOT}[/cyan]"
+        ).partition(_SLOT)
+        self._tool_done = _render_markup(self.console, " [green]✓[/green]")
         
-        # Message history: list of (role, content) tuples
+        # Message history: bounded deque of (role, content) tuples
         # role: "user" or "agent"
-        self.messages: list[tuple[str, str]] = []
+        self.messages: deque[tuple[str, str]] = deque(maxlen=MAX_HISTORY)
         self.is_processing = False
         self.exit_requested = False
         
         self.prompt_session = PromptSession()
         self.kb = self._create_keybindings()
+        
+        # /command -> handler taking the rest of the line (None if empty)
+        self._commands: dict[str, Callable[[str | None], Awaitable[None]]] = {
+            "exit": self._cmd_exit,
+            "help": self._cmd_help,
+            "clear": self._cmd_clear,
+            "allow": self._cmd_allow,
+            "server": self._handle_server_command,
+            "status": self._cmd_status,
+        }
+        self._server_commands: dict[str, Callable[[], Awaitable[None]]] = {
+            "start": self._server_start,
+            "stop": self._server_stop,
+            "restart": self._server_restart,
+            "status": self._show_status,
+        }
     
     def _create_keybindings(self) -> KeyBindings:
         """Create key bindings for the prompt"""
@@ -87,27 +230,36 @@ class GlodTUIEditor:
         # Add user message to history
         self.messages.append(("user", message))
         self.is_processing = True
-        streaming_response = ""
+        response_parts: list[str] = []
+        # Model text carries no markup, so it skips Rich and goes straight to stdout in batches
+        chunks = _ChunkBuffer(self._stdout_write, self._stdout_flush)
 
         try:
-            self.console.print()  # Blank line before response
-            self.console.print("[bold green]Agent:[/bold green]", end=" ")
+            # Blank line, then the label
+            chunks.append(self._agent_label)
+            chunks.flush()
             
             # Stream response events
-            async for event in self.session.send_prompt_stream(message):
+            async for event in _read_ahead(self.session.send_prompt_stream(message)):
                 if event.type == EventType.CHUNK:
-                    self.console.print(event.content, end="", highlight=False)
-                    streaming_response += event.content
+                    chunks.append(event.content)
+                    response_parts.append(event.content)
+                    continue
+                
+                if event.type == EventType.TOOL_CALL:
+                    chunks.append(f"{self._tool_call_open}{event.content}{self._tool_call_close}")
+                    chunks.flush()
+                    continue
                 
-                elif event.type == EventType.TOOL_CALL:
-                    tool_msg = f"[cyan]→ {event.content}[/cyan]"
-                    self.console.print(f"\n{tool_msg}", end="")
+                if event.type == EventType.TOOL_RESULT:
+                    chunks.append(self._tool_done)
+                    chunks.flush()
+                    continue
                 
-                elif event.type == EventType.TOOL_RESULT:
-                    result_msg = f" [green]✓[/green]"
-                    self.console.print(result_msg, end="")
+                # Anything else prints through Rich, after the text that preceded it
+                chunks.flush()
                 
-                elif event.type == EventType.TOOL_PHASE_START:
+                if event.type == EventType.TOOL_PHASE_START:
                     self.console.print("\n[yellow]⚙️  Tool phase started[/yellow]")
                 
                 elif event.type == EventType.TOOL_PHASE_END:
@@ -119,57 +271,61 @@ class GlodTUIEditor:
                 elif event.type == EventType.ERROR:
                     error_msg = f"[red]Error: {event.content}[/red]"
                     self.console.print(f"\n{error_msg}", end="")
+                
+                elif event.type == EventType.RETRY_WAIT:
+                    self.console.print(f"\n[dim]{event.content}[/dim]")
+            
+            chunks.flush()
             
             # Add final response to messages
-            if streaming_response:
-                self.messages.append(("agent", streaming_response))
+            if response_parts:
+                self.messages.append(("agent", "".join(response_parts)))
             
             self.console.print("\n")  # Blank line after response
         
         except Exception as e:
+            chunks.flush()
             error_msg = f"[red]Error:[/red] {str(e)}"
             self.messages.append(("agent", str(e)))
             self.console.print(f"\n{error_msg}\n")
         
         finally:
+            chunks.flush()
             self.is_processing = False
 
     async def _handle_command(self, command_str: str) -> None:
         """Handle / commands"""
-        stripped = command_str.strip()[1:].lower()
-        parts = stripped.split(maxsplit=1)
-        command = parts[0]
-        
-        if command == "exit":
-            self.exit_requested = True
+        command, _, arg = command_str.strip()[1:].partition(" ")
+        command = command.lower()
+        handler = self._commands.get(command)
+        if handler is None:
+            self.console.print(f"[red]Unknown command:[/red] /{command}\n")
             return
-        
-        elif command == "help":
-            await self._show_help()
-        
-        elif command == "clear":
-            self.messages.clear()
-            self.session.clear_history()
-            self.console.print("[green]✓ Message history cleared[/green]\n")
-        
-        elif command == "allow":
-            if len(parts) > 1:
-                result = await self.session.add_allowed_dir(parts[1])
-                if result.get("status") == "ok":
-                    self.console.print(f"[green]✓ Added allowed directory: {result.get('path')}[/green]\n")
-                else:
-                    self.console.print(f"[red]Error: {result.get('message')}[/red]\n")
-            else:
-                self.console.print("[yellow]Usage:[/yellow] /allow <directory_path>\n")
-        
-        elif command == "server":
-            await self._handle_server_command(parts[1] if len(parts) > 1 else None)
-        
-        elif command == "status":
-            await self._show_status()
-        
+        await handler(arg.strip() or None)
+    
+    async def _cmd_exit(self, arg: str | None) -> None:
+        self.exit_requested = True
+    
+    async def _cmd_help(self, arg: str | None) -> None:
+        await self._show_help()
+    
+    async def _cmd_clear(self, arg: str | None) -> None:
+        self.messages.clear()
+        self.session.clear_history()
+        self.console.print("[green]✓ Message history cleared[/green]\n")
+    
+    async def _cmd_allow(self, arg: str | None) -> None:
+        if arg is None:
+            self.console.print("[yellow]Usage:[/yellow] /allow <directory_path>\n")
+            return
+        result = await self.session.add_allowed_dir(arg)
+        if result.get("status") == "ok":
+            self.console.print(f"[green]✓ Added allowed directory: {result.get('path')}[/green]\n")
         else:
-            self.console.print(f"[red]Unknown command:[/red] /{command}\n")
+            self.console.print(f"[red]Error: {result.get('message')}[/red]\n")
+    
+    async def _cmd_status(self, arg: str | None) -> None:
+        await self._show_status()
     
     async def _handle_server_command(self, subcommand: str | None = None) -> None:
         """Handle /server commands"""
@@ -177,37 +333,37 @@ class GlodTUIEditor:
             self.console.print("[yellow]Usage:[/yellow] /server [start|stop|restart|status]\n")
             return
         
-        subcommand = subcommand.lower()
-        
-        if subcommand == "start":
-            if self.session.start_server():
-                await asyncio.sleep(1)
-                self.console.print("[green]✓ Agent server started[/green]\n")
-            else:
-                self.console.print("[red]✗ Failed to start agent server[/red]\n")
-        
-        elif subcommand == "stop":
-            if self.session.stop_server():
-                self.console.print("[green]✓ Agent server stopped[/green]\n")
-            else:
-                self.console.print("[red]✗ Failed to stop agent server[/red]\n")
-        
-        elif subcommand == "restart":
-            if self.session.restart_server():
-                await asyncio.sleep(1)
-                try:
-                    await self.session.sync_allowed_dirs()
-                except Exception:
-                    pass  # Best effort
-                self.console.print("[green]✓ Agent server restarted[/green]\n")
-            else:
-                self.console.print("[red]✗ Failed to restart agent server[/red]\n")
-        
-        elif subcommand == "status":
-            await self._show_status()
-        
+        handler = self._server_commands.get(subcommand.lower())
+        if handler is None:
+            self.console.print(f"[red]Unknown server command:[/red] {subcommand.lower()}\n")
+            return
+        await handler()
+    
+    async def _server_start(self) -> None:
+        if not await self.session.start_server():
+            self.console.print("[red]✗ Failed to start agent server[/red]\n")
+        elif await self.session.server_manager.wait_ready(5.0):
+            self.console.print("[green]✓ Agent server started[/green]\n")
         else:
-            self.console.print(f"[red]Unknown server command:[/red] {subcommand}\n")
+            self.console.print("[red]✗ Agent server start timed out[/red]\n")
+    
+    async def _server_stop(self) -> None:
+        if await self.session.stop_server():
+            self.console.print("[green]✓ Agent server stopped[/green]\n")
+        else:
+            self.console.print("[red]✗ Failed to stop agent server[/red]\n")
+    
+    async def _server_restart(self) -> None:
+        if not await self.session.restart_server():
+            self.console.print("[red]✗ Failed to restart agent server[/red]\n")
+        elif not await self.session.server_manager.wait_ready(5.0):
+            self.console.print("[red]✗ Agent server restart timed out[/red]\n")
+        else:
+            try:
+                await self.session.sync_allowed_dirs()
+            except Exception:
+                pass  # Best effort
+            self.console.print("[green]✓ Agent server restarted[/green]\n")
     
     async def _show_status(self) -> None:
         """Display server and session status"""
@@ -220,16 +376,4 @@ class GlodTUIEditor:
     
     async def _show_help(self) -> None:
         """Display help"""
-        help_text = """[bold cyan]Available Commands:[/bold cyan]
-
-[yellow]/allow <path>[/yellow]        Add a directory to allowed file access paths
-[yellow]/clear[/yellow]              Clear message history
-[yellow]/server start[/yellow]       Start the agent server
-[yellow]/server stop[/yellow]        Stop the agent server
-[yellow]/server restart[/yellow]     Restart the agent server
-[yellow]/server status[/yellow]      Check agent server status
-[yellow]/status[/yellow]             Show server and session status
-[yellow]/help[/yellow]               Show this help message
-[yellow]/exit[/yellow]               Exit GLOD
-"""
-        self.console.print(help_text + "\n")
+        self.console.print(HELP_TEXT)
@@ -0,0 +1,8 @@
+import pytest
+
+from server.tools import code_understanding
+
+@pytest.fixture(autouse=True)
+def _analysis_cache_dir(tmp_path, monkeypatch):
+    # Keep the on-disk analysis index out of the real ~/.cache
+    monkeypatch.setattr(code_understanding, "_CACHE_DIR", tmp_path / "analysis-cache")
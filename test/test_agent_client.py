@@ -0,0 +1,29 @@
+import asyncio
+
+import httpx
+
+from client import agent_client
+from client.agent_client import AgentClient, EventType
+
+def _client(handler):
+    client = AgentClient()
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+async def _event_types(client):
+    return [event.type async for event in client.run_stream("hi")]
+
+def test_backoff_is_announced_and_reset_by_health_check(monkeypatch):
+    monkeypatch.setattr(agent_client, "_BACKOFF_INITIAL", 0.01)
+    status = {"code": 503}
+    client = _client(lambda request: httpx.Response(status["code"]))
+
+    async def scenario():
+        assert await _event_types(client) == [EventType.ERROR]
+        # The failure is surfaced before the next stream waits it out
+        assert await _event_types(client) == [EventType.RETRY_WAIT, EventType.ERROR]
+        status["code"] = 200
+        assert await client.health_check()
+        assert await _event_types(client) == []
+
+    asyncio.run(scenario())
@@ -14,4 +14,26 @@ def test_subdir_valid_access():
 def test_invalid_access():
     app = App()
     app.allow_path(Path("etc/blah"))
-    assert not app.can_access(Path("etc/blah2"))
\ No newline at end of file
+    assert not app.can_access(Path("etc/blah2"))
+
+def test_multiple_roots_access():
+    app = App()
+    app.allow_path(Path("/srv/one"))
+    app.allow_path(Path("/srv/two"))
+    assert app.can_access(Path("/srv/one/a.py"))
+    assert app.can_access(Path("/srv/two/sub/b.py"))
+    assert not app.can_access(Path("/srv"))
+    assert not app.can_access(Path("/srv/three"))
+
+def test_relative_and_absolute_roots_are_distinct():
+    app = App()
+    app.allow_path(Path("etc/blah"))
+    assert not app.can_access(Path("/etc/blah"))
+
+def test_allow_path_bumps_generation():
+    app = App()
+    generation = app.generation
+    app.allow_path(Path("etc/blah"))
+    assert app.generation == generation + 1
+    app.allow_path(Path("etc/blah"))
+    assert app.generation == generation + 1
@@ -0,0 +1,73 @@
+import itertools
+
+import server.app
+from server.app import App
+from server.tools import code_understanding as cu
+
+SOURCE = '''
+import os
+
+def helper():
+    return os.getcwd()
+
+def main():
+    helper()
+'''
+
+def _analyzer():
+    analyzer = cu.CodeAnalyzer(SOURCE)
+    analyzer.visit(cu._parse(SOURCE, "mod.py"))
+    return analyzer
+
+def test_index_round_trips_as_json(tmp_path, monkeypatch):
+    monkeypatch.setattr(cu, "_CACHE_DIR", tmp_path)
+    analyzer = _analyzer()
+    cu._store_index("/src/mod.py", 1, 2, analyzer)
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+    loaded = cu._load_index("/src/mod.py", 1, 2)
+    assert loaded.functions == analyzer.functions
+    assert loaded.call_graph["main"] == {"helper"}
+    assert loaded.called_by["helper"] == {"main"}
+
+def test_index_ignores_stale_and_foreign_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(cu, "_CACHE_DIR", tmp_path)
+    cu._store_index("/src/mod.py", 1, 2, _analyzer())
+    assert cu._load_index("/src/mod.py", 1, 3) is None
+    # An entry is only valid for the path it was written for
+    cu._index_path("/src/other.py").write_bytes(cu._index_path("/src/mod.py").read_bytes())
+    assert cu._load_index("/src/other.py", 1, 2) is None
+
+def test_index_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(cu, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cu, "_CACHE_MAX_ENTRIES", 4)
+    monkeypatch.setattr(cu, "_PRUNE_EVERY", 1)
+    analyzer = _analyzer()
+    for i in range(10):
+        cu._store_index(f"/src/mod{i}.py", 1, 2, analyzer)
+    assert len(list(tmp_path.iterdir())) <= 4
+
+def test_index_prunes_only_every_few_stores(tmp_path, monkeypatch):
+    monkeypatch.setattr(cu, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cu, "_PRUNE_EVERY", 4)
+    monkeypatch.setattr(cu, "_store_count", itertools.count())
+    prunes = []
+    monkeypatch.setattr(cu, "_prune_index", lambda: prunes.append(1))
+    analyzer = _analyzer()
+    for i in range(9):
+        cu._store_index(f"/src/mod{i}.py", 1, 2, analyzer)
+    assert len(prunes) == 3
+
+def test_analyze_imports_many_matches_in_process(tmp_path, monkeypatch):
+    app = App()
+    app.allow_path(tmp_path.resolve())
+    monkeypatch.setattr(server.app, "_app_instance", app)
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"mod{i}.py"
+        path.write_text(f"import os\nfrom json import loads\nimport mod{i + 1}\n")
+        paths.append(str(path))
+    in_process = cu.analyze_imports_many(paths)
+    monkeypatch.setattr(cu, "_PARALLEL_IMPORTS_MIN", 1)
+    assert cu.analyze_imports_many(paths) == in_process
+    assert cu._import_pool is not None
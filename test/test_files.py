@@ -0,0 +1,176 @@
+import shutil
+import stat
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import server.app
+from server.app import App
+from server.tools import files
+
+GREP_TEXT = """def foo(x):
+    return foo(x) + bar(x)
+a|b
+a+b
+aab
+{1}
+x{2}
+xx
+ab^c
+a$b
+*star
+(ab)
+abab
+tab\there
+word swords
+digits 123
+back\\slash
+"""
+
+@pytest.fixture
+def sandbox(tmp_path, monkeypatch):
+    app = App()
+    app.allow_path(tmp_path.resolve())
+    monkeypatch.setattr(server.app, "_app_instance", app)
+    files._invalidate_caches()
+    return tmp_path
+
+def _system_grep(path, pattern, flags):
+    result = subprocess.run(["grep", *flags, "--", pattern, path], capture_output=True, text=True)
+    assert result.returncode in (0, 1), result.stderr
+    return result.stdout if result.returncode == 0 else "error: no matches found"
+
+@pytest.mark.skipif(shutil.which("grep") is None, reason="needs grep(1)")
+@pytest.mark.parametrize("flags, pattern", [
+    ([], "def foo("),
+    ([], "foo(x)"),
+    ([], "a|b"),
+    ([], r"a\|b"),
+    ([], "a+b"),
+    ([], r"a\+b"),
+    ([], "{1}"),
+    ([], r"x\{2\}"),
+    ([], r"\(ab\)\{2\}"),
+    ([], "ab^c"),
+    ([], "a$b"),
+    ([], "^a"),
+    ([], "b$"),
+    ([], "*star"),
+    ([], "^*"),
+    ([], "[[:digit:]]\\+"),
+    ([], "[]x]"),
+    ([], "back\\\\slash"),
+    ([], r"\<word\>"),
+    (["-n"], "(ab)"),
+    (["-w"], "word"),
+    (["-x"], "xx"),
+    (["-i", "-c"], "A"),
+    (["-v"], "a"),
+    (["-E"], "a|b"),
+    (["-E"], "(ab){2}"),
+    (["-E"], r"a\+b"),
+    (["-E"], "x{2"),
+    (["-E"], "[[:alpha:]]+[0-9]"),
+    (["-F"], "a|b"),
+    (["-F", "-w"], "(ab)"),
+    (["-F", "-w"], "a|b"),
+    (["-F", "-x"], "a+b"),
+    (["-F", "-i", "-n"], "AAB"),
+    (["-w"], "swords"),
+    (["-w"], "sword"),
+    (["-v", "-n"], "word"),
+    (["-n", "-E"], "^(def|  )"),
+])
+def test_grep_matches_system_grep(sandbox, flags, pattern):
+    path = sandbox / "sample.txt"
+    path.write_text(GREP_TEXT)
+    assert files.grep(str(path), pattern, flags) == _system_grep(str(path), pattern, flags)
+
+def test_grep_regex_runs_system_grep_with_output_cap(sandbox):
+    path = sandbox / "many.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(300)))
+    output = files.grep(str(path), "^line [0-9]\\+$", ["-n"])
+    lines = output.splitlines()
+    assert lines[:2] == ["1:line 0", "2:line 1"]
+    assert len(lines) == files._GREP_MAX_MATCHES + 1
+    assert lines[-1].startswith("... (truncated after 200 matches")
+
+def test_grep_regex_times_out(sandbox, monkeypatch):
+    monkeypatch.setattr(files, "_GREP_TIMEOUT", 1e-6)
+    path = sandbox / "sample.txt"
+    path.write_text(GREP_TEXT)
+    assert files.grep(str(path), "a\\+b") == "error: grep timed out after 1e-06s"
+
+@pytest.mark.parametrize("edit, expected", [
+    (lambda p: files.delete(p, 2, 2), "a\nc\n"),
+    (lambda p: files.delete(p, 2, 10), "a\n"),
+    (lambda p: files.insert(p, 1, "x"), "x\na\nb\nc\n"),
+    (lambda p: files.insert(p, 4, "x"), "a\nb\nc\nx\n"),
+    (lambda p: files.insert(p, 9, "x"), "a\nb\nc\nx\n"),
+    (lambda p: files.replace(p, 3, 3, "x"), "a\nb\nx\n"),
+    (lambda p: files.replace(p, 2, 3, "x\ny"), "a\nx\ny\n"),
+    (lambda p: files.insert_many(p, {1: "x", 3: "y", 4: "z"}), "x\na\nb\ny\nc\nz\n"),
+])
+def test_line_edits(sandbox, edit, expected):
+    path = sandbox / "lines.txt"
+    path.write_text("a\nb\nc\n")
+    assert edit(str(path)).startswith("success")
+    assert path.read_text() == expected
+
+def test_line_edits_on_empty_file(sandbox):
+    path = sandbox / "empty.txt"
+    path.write_text("")
+    assert files.insert(str(path), 1, "x").startswith("success")
+    assert path.read_text() == "x\n"
+    path.write_text("")
+    assert files.insert_many(str(path), {1: "x", 2: "y"}).startswith("success")
+    assert path.read_text() == "x\ny\n"
+
+def test_line_edits_keep_permissions(sandbox):
+    path = sandbox / "script.sh"
+    path.write_text("a\nb\n")
+    path.chmod(0o750)
+    assert files.replace(str(path), 1, 1, "x").startswith("success")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o750
+    assert list(sandbox.iterdir()) == [path]
+
+def test_read_numbers_lines_from_one(sandbox, monkeypatch):
+    path = sandbox / "lines.txt"
+    path.write_text("a\nb\nc\n")
+    assert files.read(str(path)) == "1: a\n2: b\n3: c\n"
+    # end_line is inclusive
+    assert files.read(str(path), 2, 3) == "2: b\n3: c\n"
+    # Edits are visible to the next read
+    files.insert(str(path), 1, "x")
+    assert files.read(str(path), 1, 2) == "1: x\n2: a\n"
+    # Large files take the mmap path, which must number lines the same way
+    monkeypatch.setattr(files, "_READ_CACHE_MAX_SIZE", 0)
+    assert files.read(str(path), 2, 3) == "2: a\n3: b\n"
+
+def test_list_files_is_safe_under_concurrent_use(sandbox, monkeypatch):
+    monkeypatch.setattr(files, "_LISTING_MAX_ENTRIES", 2)
+    dirs = []
+    for i in range(8):
+        (sandbox / f"d{i}").mkdir()
+        (sandbox / f"d{i}" / "f.txt").write_text("x")
+        dirs.append(str(sandbox / f"d{i}"))
+
+    def work(i):
+        for _ in range(200):
+            if i == 0:
+                files._invalidate_caches()
+            assert files.list_files(dirs[i]) == [dirs[i] + "/f.txt"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(8)))
+
+def test_list_files_does_not_cache_listing_raced_by_a_write(sandbox, monkeypatch):
+    uncached = files._list_files_uncached
+    def listing_during_write(filepath, recursive):
+        ret = uncached(filepath, recursive)
+        files._invalidate_caches()
+        return ret
+    monkeypatch.setattr(files, "_list_files_uncached", listing_during_write)
+    files.list_files(str(sandbox))
+    assert files._listing_cache == {}
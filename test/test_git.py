@@ -0,0 +1,88 @@
+import subprocess
+import threading
+
+import pygit2
+import pytest
+
+import server.app
+from server.app import App
+from server.tools import files, git
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    app = App()
+    app.allow_path(tmp_path.resolve())
+    monkeypatch.setattr(server.app, "_app_instance", app)
+    for var in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{var}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+    files._invalidate_caches()
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "a.txt").write_text("one\n")
+    _git(tmp_path, "add", "a.txt")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+def test_checkout_refreshes_file_listing(repo):
+    _git(repo, "checkout", "-q", "-b", "feature")
+    (repo / "b.txt").write_text("two\n")
+    _git(repo, "add", "b.txt")
+    _git(repo, "commit", "-q", "-m", "add b")
+    assert "b.txt" in " ".join(files.list_files(str(repo)))
+
+    git.git_checkout("main", str(repo))
+    assert "b.txt" not in " ".join(files.list_files(str(repo)))
+
+def test_status_log_and_diff_match_git(repo):
+    (repo / "a.txt").write_text("one\nuno\n")
+    (repo / "b.txt").write_text("staged\n")
+    _git(repo, "add", "b.txt")
+    (repo / "c.txt").write_text("untracked\n")
+    status = git.git_status(str(repo))
+    assert status == _git(repo, "status")
+    assert "Changes to be committed" in status and "Untracked files" in status
+    assert git.git_diff(repo_path=str(repo)) == _git(repo, "diff")
+    assert git.git_diff("a.txt", str(repo)) == _git(repo, "diff", "--", "a.txt")
+    assert git.git_diff("c.txt", str(repo)) == "no changes"
+
+    _git(repo, "commit", "-q", "-m", "second\n\nbody")
+    assert git.git_log(repo_path=str(repo)) == _git(repo, "log", "--format=%h %s")
+    assert git.git_log(1, str(repo)) == _git(repo, "log", "-1", "--format=%h %s")
+
+def test_commit_all_adds_untracked_files(repo):
+    (repo / "a.txt").write_text("changed\n")
+    (repo / "new.txt").write_text("new\n")
+    (repo / "other.txt").write_text("other\n")
+    _git(repo, "add", "other.txt")
+
+    assert not git.git_commit_all(["a.txt", "new.txt"], "commit some", str(repo)).startswith("error")
+    assert _git(repo, "show", "--name-only", "--format=%s", "HEAD").split() == ["commit", "some", "a.txt", "new.txt"]
+    # Files that were staged but not listed stay staged and uncommitted
+    assert _git(repo, "status", "--short") == "A  other.txt\n"
+    assert "new file:   other.txt" in git.git_status(str(repo))
+
+def test_repo_cache_is_per_repo_and_per_thread(repo):
+    (repo / "sub").mkdir()
+    first = git._repo(str(repo))
+    # Subdirectories share the repository's entry
+    assert git._repo(str(repo / "sub")) is first
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(git._repo(str(repo))))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+
+    git._forget_repo(str(repo / "sub"))
+    assert git._repo(str(repo)) is not first
+
+def test_repo_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(git, "_REPO_CACHE_MAX", 2)
+    monkeypatch.setattr(git, "_repo_local", threading.local())
+    for i in range(4):
+        pygit2.init_repository(str(tmp_path / f"r{i}"))
+        git._repo(str(tmp_path / f"r{i}"))
+    assert len(git._repo_local.repos) == 2
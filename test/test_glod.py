@@ -0,0 +1,72 @@
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+import server.app
+from server.app import App
+
+@pytest.fixture
+def glod(tmp_path, monkeypatch):
+    """server.tools.glod, imported against a recording stand-in for server.lib.glod"""
+    calls = []
+
+    def read(project_root, name):
+        calls.append(name)
+        path = project_root / ".glod" / name
+        return path.read_text() if path.exists() else None
+
+    lib = types.ModuleType("server.lib.glod")
+    lib.get_overview = lambda root: read(root, "overview.md")
+    lib.get_config = lambda root: {"raw": read(root, "config.json")}
+    lib.get_project_info = lambda root: {"overview": read(root, "overview.md"), "tools": []}
+    package = types.ModuleType("server.lib")
+    package.glod = lib
+    monkeypatch.setitem(sys.modules, "server.lib", package)
+    monkeypatch.setitem(sys.modules, "server.lib.glod", lib)
+    monkeypatch.delitem(sys.modules, "server.tools.glod", raising=False)
+    module = importlib.import_module("server.tools.glod")
+
+    app = App()
+    app.allow_path(tmp_path.resolve())
+    monkeypatch.setattr(server.app, "_app_instance", app)
+    (tmp_path / ".glod").mkdir()
+    (tmp_path / ".glod" / "overview.md").write_text("code lives in src/\n")
+    (tmp_path / ".glod" / "config.json").write_text("{}")
+    yield module, calls
+    sys.modules.pop("server.tools.glod", None)
+
+def test_overview_and_structure_share_one_load(glod, tmp_path):
+    module, calls = glod
+    assert module.get_project_overview(str(tmp_path)) == "code lives in src/\n"
+    info = module.get_project_structure_info(str(tmp_path))
+    assert info["has_src_dir"] and "has_tests_dir" not in info
+    assert calls == ["overview.md"]
+
+    # An edit changes the mtime key and is picked up
+    overview = tmp_path / ".glod" / "overview.md"
+    overview.write_text("see tests/ and a longer overview\n")
+    os.utime(overview, ns=(0, overview.stat().st_mtime_ns + 10**9))
+    assert "has_tests_dir" in module.get_project_structure_info(str(tmp_path))
+    assert calls == ["overview.md", "overview.md"]
+
+def test_config_is_cached_and_copied(glod, tmp_path):
+    module, calls = glod
+    config = module.get_project_config(str(tmp_path))
+    config["raw"] = "mutated"
+    assert module.get_project_config(str(tmp_path)) == {"raw": "{}"}
+    assert calls == ["config.json"]
+
+def test_full_project_info_is_memoized_until_glod_changes(glod, tmp_path):
+    module, calls = glod
+    first = module.get_full_project_info(str(tmp_path))
+    first["tools"].append("mutated")
+    assert module.get_full_project_info(str(tmp_path)) == {"overview": "code lives in src/\n", "tools": []}
+    assert calls == ["overview.md"]
+
+    # Saved metadata (or any new .glod file) changes the key
+    (tmp_path / ".glod" / "analysis.json").write_text("{}")
+    module.get_full_project_info(str(tmp_path))
+    assert calls == ["overview.md", "overview.md"]
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import server_manager
+from server_manager import ServerManager
+
+def _child(seconds):
+    return subprocess.Popen([sys.executable, "-c", f"import time; time.sleep({seconds})"])
+
+def test_startup_ignores_foreign_listener(monkeypatch, tmp_path):
+    manager = ServerManager(project_root=tmp_path)
+    monkeypatch.setattr(manager, "_is_port_in_use", lambda port=8000, max_age=0.1: True)
+    # Something else already holds the port; the child exits without ever binding it
+    monkeypatch.setattr(server_manager, "_find_pid_on_port", lambda port: 1)
+    manager.process = _child(0.2)
+    assert manager._wait_for_startup(timeout=5.0) is False
+    assert manager.process.poll() is not None
+
+def test_startup_ready_once_child_listens(monkeypatch, tmp_path):
+    manager = ServerManager(project_root=tmp_path)
+    monkeypatch.setattr(manager, "_is_port_in_use", lambda port=8000, max_age=0.1: True)
+    manager.process = _child(5)
+    monkeypatch.setattr(server_manager, "_find_pid_on_port", lambda port: manager.process.pid)
+    try:
+        assert manager._wait_for_startup(timeout=1.0) is True
+    finally:
+        manager.process.kill()
+        manager.process.wait()
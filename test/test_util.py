@@ -0,0 +1,23 @@
+import os
+
+import server.app
+from server.app import App
+from server.tools import files
+from server.tools.util import _check_access
+
+def test_access_rechecked_after_symlink_swap(tmp_path, monkeypatch):
+    app = App()
+    monkeypatch.setattr(server.app, "_app_instance", app)
+    allowed = tmp_path / "allowed"
+    allowed.mkdir()
+    target = allowed / "f.txt"
+    target.write_text("public\n")
+    outside = tmp_path / "outside.txt"
+    outside.write_text("secret\n")
+    app.allow_path(allowed.resolve())
+
+    assert _check_access(str(target))
+    target.unlink()
+    os.symlink(outside, target)
+    assert not _check_access(str(target))
+    assert files.read(str(target)).startswith("error")
@@ -5,6 +5,7 @@ Test script for code understanding tools implementation
 import sys
 import os
 import json
+import tempfile
 from pathlib import Path
 
 # Add src to path
@@ -16,6 +17,9 @@ os.chdir(Path(__file__).parent)
 from server.app import get_app
 from server.tools import code_understanding
 
+# Keep the on-disk analysis index out of the real ~/.cache
+code_understanding._CACHE_DIR = Path(tempfile.mkdtemp(prefix='glod-test-')) / 'analysis'
+
 # Setup allowed paths for testing
 app = get_app()
 app.allow_path(Path('.').resolve())
@@ -159,7 +163,7 @@ def test_pydantic_tools():
     for tool in tools:
         print(f"  - {tool.function.name}")
     print()
-    return len(tools) == 4
+    return len(tools) == 5
 
 if __name__ == "__main__":
     tests = [